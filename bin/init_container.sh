@@ -1,6 +1,8 @@
 #!/bin/sh
 set -e
 
+python manage.py createcachetable
+
 if [ "$ENVIROMENT" = "dev" ]; then
     make app-start-debug
 else
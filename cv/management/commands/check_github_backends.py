@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services import github_check
+
+
+class Command(BaseCommand):
+    help = 'Compare the REST and GraphQL GitHub backends against a local stub, without network access'
+
+    def handle(self, *args, **options):
+        failed = False
+        for mode, differences in github_check.run().items():
+            self.stdout.write(f'[languages: {mode}]')
+            for field, rest, graphql in differences:
+                failed = True
+                self.stdout.write(self.style.ERROR(f'  {field}: REST {rest!r}, GraphQL {graphql!r}'))
+
+        if failed:
+            raise CommandError('The GraphQL backend output differs from the REST one')
+        self.stdout.write(self.style.SUCCESS('Both GitHub backends return the same stats'))
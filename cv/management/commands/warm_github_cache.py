@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.github_service import refresh_accounts
+
+
+class Command(BaseCommand):
+    help = 'Refresh the cached GitHub stats of every served account, once or periodically'
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*', help='Accounts to refresh, GITHUB_ACCOUNTS by default')
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'GITHUB_BATCH_WORKERS', 4))
+        parser.add_argument('--reserve', type=int, default=getattr(settings, 'GITHUB_BATCH_RATE_RESERVE', 100),
+                            help='Rate limit requests left untouched for live traffic')
+        parser.add_argument('--interval', type=float, default=0, help='Seconds between runs, 0 runs once')
+
+    def handle(self, *args, **options):
+        usernames = options['usernames'] or getattr(settings, 'GITHUB_ACCOUNTS', ['zabbix-byte'])
+
+        try:
+            while True:
+                started = time.monotonic()
+                results = refresh_accounts(usernames, workers=options['workers'], reserve=options['reserve'])
+                for username, outcome in results.items():
+                    style = {'refreshed': self.style.SUCCESS, 'failed': self.style.ERROR}.get(outcome, self.style.WARNING)
+                    self.stdout.write(style(f'{username}: {outcome}'))
+                self.stdout.write(f'Refreshed {len(results)} accounts in {time.monotonic() - started:.1f}s')
+
+                if not options['interval']:
+                    break
+                time.sleep(max(0, options['interval'] - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            self.stdout.write('Stopping')
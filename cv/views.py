@@ -1,10 +1,16 @@
+from datetime import datetime, timezone
 from pathlib import Path
 
 from django.conf import settings
 from django.http import FileResponse, Http404, JsonResponse
 from django.shortcuts import render
-from services.github_service import GitHubService
-from services.pdf_service import generate_cv_pdf_response
+from django.views.decorators.http import condition
+from services.github_service import get_github_service
+from services.pdf_service import (
+    cached_cv_pdf_mtime,
+    cv_pdf_etag,
+    generate_cv_pdf_response,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -56,7 +62,12 @@ def press(request):
 def github_data_api(request):
     """API endpoint to fetch fresh GitHub data (for AJAX updates)"""
     if request.method == "GET":
-        github_service = GitHubService(username="zabbix-byte")
+        accounts = getattr(settings, "GITHUB_ACCOUNTS", ["zabbix-byte"])
+        username = request.GET.get("username", accounts[0])
+        if username not in accounts:
+            return JsonResponse({"success": False, "error": "Unknown account"}, status=404)
+
+        github_service = get_github_service(username=username)
 
         try:
             github_data = github_service.get_comprehensive_stats()
@@ -68,20 +79,30 @@ def github_data_api(request):
     return JsonResponse({"error": "Method not allowed"}, status=405)
 
 
+CV_CONTEXT = {
+    "name": "Vasile Ovidiu Ichim",
+    "title": "Co-founder &amp; CTO · Valerdat",
+    "location": "Barcelona, Spain",
+    "email": "zabbix@ztrunk.space",
+    "github_url": "https://github.com/zabbix-byte",
+    "linkedin_url": "https://linkedin.com/in/zabbix-byte",
+}
+
+
+def _cv_pdf_last_modified(request):
+    mtime = cached_cv_pdf_mtime(CV_CONTEXT)
+    return datetime.fromtimestamp(mtime, tz=timezone.utc) if mtime else None
+
+
+@condition(
+    etag_func=lambda request: cv_pdf_etag(CV_CONTEXT),
+    last_modified_func=_cv_pdf_last_modified,
+)
 def download_cv_pdf(request):
-    """Generate and download CV as PDF"""
+    """Download the CV as PDF, rendered once per content hash and revalidated with ETags"""
     try:
-        context = {
-            "name": "Vasile Ovidiu Ichim",
-            "title": "Co-founder &amp; CTO · Valerdat",
-            "location": "Barcelona, Spain",
-            "email": "zabbix@ztrunk.space",
-            "github_url": "https://github.com/zabbix-byte",
-            "linkedin_url": "https://linkedin.com/in/zabbix-byte",
-        }
-
-        logger.info("Generating CV PDF for download")
-        return generate_cv_pdf_response(context)
+        logger.info("Serving CV PDF for download")
+        return generate_cv_pdf_response(CV_CONTEXT, request)
 
     except Exception as e:
         logger.error(f"Error generating CV PDF: {str(e)}")
@@ -11,6 +11,8 @@ class Experience:
         self.group = []
 
     def serrialize_groups(self):
+        if not self.group:
+            return
         for i in range(len(self.group)):
             if type(self.group[i]) == dict:
                 continue
@@ -0,0 +1,105 @@
+"""
+Offline benchmark for the LinkedIn parsers.
+
+Every fixture directory under benchmarks/fixtures holds the html captured for one
+profile (general.html plus one file per Linkedin.SECTIONS entry) and a golden.json
+with the serialized profile the parsers are expected to produce.
+"""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from scraper.Domain import Profile
+from scraper.extraction import ExtractionReport
+from scraper.linkedin import Linkedin
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / 'fixtures'
+GOLDEN_FILE = 'golden.json'
+
+
+def empty_profile() -> Profile:
+    return Profile(name='', aptitudes=[], education=[], experiences=[], licences=[], projects=[])
+
+
+def load_fixture(directory: Path) -> dict:
+    pages = {'general': (directory / 'general.html').read_text()}
+    for section in Linkedin.SECTIONS:
+        pages[section.name] = (directory / f'{section.name}.html').read_text()
+    return pages
+
+
+def flatten(value, prefix: str = '') -> dict:
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return {prefix: value}
+
+    flat = {}
+    for key, child in items:
+        flat.update(flatten(child, f'{prefix}.{key}' if prefix else str(key)))
+    if not flat:
+        flat[prefix] = value
+    return flat
+
+
+def compare(expected: dict, actual: dict) -> list:
+    """Field level differences as (field, expected, actual) tuples."""
+    expected, actual = flatten(expected), flatten(actual)
+    return [
+        (field, expected.get(field), actual.get(field))
+        for field in sorted(expected.keys() | actual.keys())
+        if expected.get(field) != actual.get(field)
+    ]
+
+
+def time_parser(name: str, parser: str, html: str, repeat: int) -> dict:
+    if name == 'general':
+        run = lambda: Linkedin.get_general_info(html)
+    else:
+        run = lambda: getattr(Linkedin, parser)(html, empty_profile())
+
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'parser': parser,
+        'pages_per_second': repeat / elapsed if elapsed else float('inf'),
+        'mb_per_second': len(html.encode()) * repeat / elapsed / 1e6 if elapsed else float('inf'),
+        'peak_kb': peak / 1024,
+    }
+
+
+def run(repeat: int = 200, update_golden: bool = False) -> list:
+    results = []
+    for directory in sorted(path for path in FIXTURES_DIR.iterdir() if path.is_dir()):
+        pages = load_fixture(directory)
+
+        report = ExtractionReport()
+        actual = Linkedin.parse_profile(pages, report)
+        golden = directory / GOLDEN_FILE
+        if update_golden:
+            golden.write_text(json.dumps(actual, indent=2, ensure_ascii=False) + '\n')
+
+        timings = [time_parser('general', 'get_general_info', pages['general'], repeat)]
+        for section in Linkedin.SECTIONS:
+            timings.append(time_parser(section.name, section.parser, pages[section.name], repeat))
+
+        results.append({
+            'fixture': directory.name,
+            'timings': timings,
+            'differences': compare(json.loads(golden.read_text()), actual),
+            'report': report.serrialize(),
+        })
+    return results
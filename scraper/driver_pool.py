@@ -0,0 +1,169 @@
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+
+# requests dropped in low bandwidth mode, we only ever read the text of the pages
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*media.licdn.com*',
+    '*doubleclick.net*', '*google-analytics.com*', '*googletagmanager.com*',
+    '*bing.com*', '*ads.linkedin.com*', '*px.ads.linkedin.com*', '*snap.licdn.com*',
+]
+
+
+def create_driver() -> webdriver.Chrome:
+    service = Service(executable_path=getattr(settings, 'SCRAPER_CHROMEDRIVER_PATH', r'/usr/local/bin/chromedriver'))
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-extensions")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+
+    low_bandwidth = getattr(settings, 'SCRAPER_LOW_BANDWIDTH', False)
+    if low_bandwidth:
+        # hand the page over once the DOM is parsed, the scraper waits for the content it needs
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
+
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    if low_bandwidth:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': getattr(settings, 'SCRAPER_BLOCKED_URLS', BLOCKED_URLS)
+        })
+    return driver
+
+
+class DriverPoolExhausted(Exception):
+    pass
+
+
+class PooledDriver:
+    def __init__(self, driver: webdriver.Chrome) -> None:
+        self.driver = driver
+        self.created_at = time.monotonic()
+        # li_at cookie the browser is currently logged in with
+        self.cookie = None
+
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def is_healthy(self) -> bool:
+        try:
+            return self.driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class DriverPool:
+    """
+    Process-wide pool of pre-launched headless Chrome drivers.
+    A driver is leased with `with pool.lease() as pooled:` and goes back to the pool
+    when the block exits cleanly; on error, or once it is older than max_age, it is quit.
+    """
+
+    def __init__(self, size: int = 2, max_age: float = 1800, lease_timeout: float = None) -> None:
+        self.size = size
+        self.max_age = max_age
+        self.lease_timeout = lease_timeout
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._closed = False
+
+    def warm(self, count: int = None):
+        """Launch drivers up front so the first leases skip the Chrome cold start."""
+        count = self.size if count is None else min(count, self.size)
+        with self._lock:
+            missing = count - len(self._idle)
+        for _ in range(missing):
+            pooled = PooledDriver(create_driver())
+            with self._lock:
+                self._idle.append(pooled)
+
+    def _take_idle(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                pooled = self._idle.pop()
+
+            if pooled.age() < self.max_age and pooled.is_healthy():
+                return pooled
+            pooled.quit()
+
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """`timeout` overrides the pool lease timeout, 0 fails right away when no driver is free."""
+        if self._closed:
+            raise RuntimeError('Driver pool is closed')
+
+        timeout = self.lease_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise DriverPoolExhausted('No chrome driver available in the pool')
+
+        pooled = None
+        try:
+            pooled = self._take_idle() or PooledDriver(create_driver())
+            yield pooled
+        except BaseException:
+            if pooled is not None:
+                pooled.quit()
+            raise
+        else:
+            self._release(pooled)
+        finally:
+            self._slots.release()
+
+    def _release(self, pooled: PooledDriver):
+        with self._lock:
+            if not self._closed and pooled.age() < self.max_age:
+                self._idle.append(pooled)
+                return
+        pooled.quit()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            pooled.quit()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool(
+                size=getattr(settings, 'SCRAPER_DRIVER_POOL_SIZE', 2),
+                max_age=getattr(settings, 'SCRAPER_DRIVER_MAX_AGE', 1800),
+                lease_timeout=getattr(settings, 'SCRAPER_DRIVER_LEASE_TIMEOUT', None),
+            )
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,300 @@
+import re
+
+from lxml import etree
+from lxml import html as lxml_html
+
+from scraper.Domain import Profile
+from scraper.Domain import License, Experience, Education, Project
+
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b')
+
+
+def has_class(classes: str) -> str:
+    """
+    XPath predicate with the same meaning as BeautifulSoup's {'class': classes}: a
+    single class matches any of the element classes, several must match the whole attribute.
+    """
+    if ' ' in classes:
+        return f"normalize-space(@class)='{classes}'"
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {classes} ')"
+
+
+def first(tag: str, classes: str, inner: str = None) -> etree.XPath:
+    """Compiled XPath for the first <tag class=classes> below the node, or its first <inner>."""
+    path = f'(.//{tag}[{has_class(classes)}])[1]'
+    if inner:
+        path += f'/descendant::{inner}[1]'
+    return etree.XPath(path)
+
+
+def every(tag: str, classes: str, within: str = None) -> etree.XPath:
+    """Compiled XPath for every <tag class=classes> below the node (or below its first `within` list)."""
+    path = f'.//{tag}[{has_class(classes)}]'
+    if within:
+        path = f'(.//ul[{has_class(within)}])[1]/descendant::{tag}[{has_class(classes)}]'
+    return etree.XPath(path)
+
+
+def own_first(tag: str, classes: str, inner: str = None):
+    """
+    Like first(), but skips matches that belong to a list item nested below the
+    node, e.g. the roles listed inside a grouped experience.
+    """
+    candidates = etree.XPath(f'.//{tag}[{has_class(classes)}]')
+    inner_path = etree.XPath(f'descendant::{inner}[1]') if inner else None
+
+    def find(node) -> list:
+        for candidate in candidates(node):
+            if next(candidate.iterancestors('li'), None) is node:
+                return inner_path(candidate) if inner_path is not None else [candidate]
+        return []
+    return find
+
+
+class Field:
+    def __init__(self, name: str, *paths: etree.XPath, default: str = '', required: bool = False, transform=None) -> None:
+        self.name = name
+        # alternatives tried in order, the first one matching wins
+        self.paths = paths
+        self.default = default
+        self.required = required
+        self.transform = transform
+
+
+class ExtractionReport:
+    """
+    Keeps track of the fields (or whole sections) that fell back to their default
+    and of the list items dropped because a required field was missing.
+    """
+
+    def __init__(self) -> None:
+        self.fallbacks = {}
+        self.skipped = {}
+
+    def fallback(self, field: str):
+        self.fallbacks[field] = self.fallbacks.get(field, 0) + 1
+
+    def skip(self, item: str):
+        self.skipped[item] = self.skipped.get(item, 0) + 1
+
+    def __bool__(self) -> bool:
+        return bool(self.fallbacks or self.skipped)
+
+    def serrialize(self) -> dict:
+        return {'fallbacks': dict(self.fallbacks), 'skipped': dict(self.skipped)}
+
+
+def text_of(node, path: etree.XPath):
+    found = path(node)
+    if not found:
+        return None
+    return found[0].text_content().strip()
+
+
+def extract(node, fields: list, report: ExtractionReport, prefix: str):
+    """Return the field values found under `node`, None when a required field is missing."""
+    values = {}
+    for field in fields:
+        value = None
+        for path in field.paths:
+            value = text_of(node, path)
+            if value is not None:
+                break
+
+        if value is None:
+            if field.required:
+                report.skip(prefix)
+                return None
+            report.fallback(f'{prefix}.{field.name}')
+            value = field.default
+        elif field.transform:
+            value = field.transform(value)
+
+        values[field.name] = value
+    return values
+
+
+def parse(html: str):
+    if not html or not html.strip():
+        return None
+    return lxml_html.document_fromstring(html)
+
+
+# ---- field specs, compiled once at import time --------------------------
+
+ITEM_CLASSES = 'pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column'
+GROUP_ITEM_CLASSES = 'pvs-list__paged-list-item pvs-list__item--one-column'
+
+BOLD_LINK = first('div', 'display-flex align-items-center mr1 hoverable-link-text t-bold', 'span')
+BOLD = first('div', 'display-flex align-items-center mr1 t-bold', 'span')
+SUBTITLE = first('span', 't-14 t-normal', 'span')
+CAPTION = first('span', 't-14 t-normal t-black--light', 'span')
+DESCRIPTION = first('div', 'display-flex align-items-center t-14 t-normal t-black', 'span')
+
+ITEMS = every('li', ITEM_CLASSES, within='pvs-list')
+GROUP = etree.XPath(f'(.//ul[{has_class("pvs-list")}])[1]')
+GROUP_ITEMS = every('li', GROUP_ITEM_CLASSES)
+
+GENERAL_FIELDS = [
+    Field('name', first('h1', 'text-heading-xlarge inline t-24 v-align-middle break-words')),
+    Field('title', first('div', 'text-body-medium break-words')),
+    Field('description', first(
+        'div', 'pv-shared-text-with-see-more full-width t-14 t-normal t-black display-flex align-items-center', 'span')),
+    Field('location', first('span', 'text-body-small inline t-black--light break-words')),
+]
+
+CONTACT_FIELDS = [
+    Field('phone_number', first('li', 'pv-contact-info__ci-container t-14', 'span')),
+    Field('web_page', first('li', 'pv-contact-info__ci-container link t-14', 'a')),
+]
+CONTACT_LINKS = etree.XPath(f'.//div[{has_class("pv-contact-info__ci-container t-14")}]/descendant::a[1]')
+
+LICENSE_FIELDS = [
+    Field('name', BOLD_LINK, required=True),
+    Field('emitted_by', SUBTITLE),
+    Field('expedition', CAPTION, transform=lambda value: value.split(':')[-1].strip()),
+]
+
+EXPERIENCE_FIELDS = [
+    # the item's own header, a group's first role has a bold link too
+    Field('name',
+          own_first('div', 'display-flex align-items-center mr1 hoverable-link-text t-bold', 'span'),
+          own_first('div', 'display-flex align-items-center mr1 t-bold', 'span'),
+          required=True),
+]
+EXPERIENCE_DETAIL_FIELDS = [
+    Field('time', CAPTION),
+    Field('description', DESCRIPTION),
+]
+GROUP_FIELDS = [
+    Field('name', BOLD_LINK, required=True),
+    Field('time', CAPTION),
+    Field('description', DESCRIPTION),
+]
+
+EDUCATION_FIELDS = [
+    Field('name', BOLD_LINK, required=True),
+    Field('entity', SUBTITLE),
+    Field('time', CAPTION),
+]
+
+PROJECT_FIELDS = [
+    Field('name', BOLD, required=True),
+    Field('time', SUBTITLE),
+    Field('description', DESCRIPTION),
+]
+
+
+# ---- page extractors ----------------------------------------------------
+
+def extract_general(html: str, report: ExtractionReport) -> Profile:
+    root = parse(html)
+    if root is None:
+        report.fallback('general')
+        values = {field.name: field.default for field in GENERAL_FIELDS}
+    else:
+        values = extract(root, GENERAL_FIELDS, report, 'general')
+
+    return Profile(
+        name=values['name'],
+        title=values['title'],
+        description=values['description'],
+        location=values['location'],
+        aptitudes=[],
+        education=[],
+        experiences=[],
+        licences=[],
+        projects=[],
+    )
+
+
+def extract_contact(html: str, profile: Profile, report: ExtractionReport) -> Profile:
+    root = parse(html)
+    if root is None:
+        report.fallback('contact')
+        profile.phone_number = profile.email = profile.web_page = ''
+        return profile
+
+    values = extract(root, CONTACT_FIELDS, report, 'contact')
+    profile.phone_number = values['phone_number']
+    profile.web_page = values['web_page']
+
+    profile.email = ''
+    for link in CONTACT_LINKS(root):
+        current = link.text_content().strip()
+        if EMAIL_RE.fullmatch(current):
+            profile.email = current
+            break
+    else:
+        report.fallback('contact.email')
+
+    return profile
+
+
+def list_items(html: str, report: ExtractionReport, section: str) -> list:
+    root = parse(html)
+    items = ITEMS(root) if root is not None else []
+    if root is None or not GROUP(root):
+        report.fallback(section)
+    return items
+
+
+def extract_certifications(html: str, profile: Profile, report: ExtractionReport) -> Profile:
+    for item in list_items(html, report, 'certifications'):
+        values = extract(item, LICENSE_FIELDS, report, 'certifications')
+        if values is None:
+            continue
+        profile.licences.append(License(id=len(profile.licences), **values))
+    return profile
+
+
+def extract_experience(html: str, profile: Profile, report: ExtractionReport) -> Profile:
+    for item in list_items(html, report, 'experience'):
+        values = extract(item, EXPERIENCE_FIELDS, report, 'experience')
+        if values is None:
+            continue
+
+        current_experience = Experience(name=values['name'], id=len(profile.experiences))
+
+        # group of experiences, dropped as a whole if one of its roles has no name
+        group = GROUP(item)
+        if group:
+            for element in GROUP_ITEMS(group[0]):
+                element_values = extract(element, GROUP_FIELDS, report, 'experience.group')
+                if element_values is None:
+                    current_experience.group = None
+                    break
+                sub_experience = Experience(id=len(current_experience.group), **element_values)
+                sub_experience.group = None
+                current_experience.group.append(sub_experience)
+        else:
+            current_experience.group = None
+
+        if not current_experience.group:
+            details = extract(item, EXPERIENCE_DETAIL_FIELDS, report, 'experience')
+            current_experience.time = details['time']
+            current_experience.description = details['description']
+
+        profile.experiences.append(current_experience)
+    return profile
+
+
+def extract_education(html: str, profile: Profile, report: ExtractionReport) -> Profile:
+    for item in list_items(html, report, 'education'):
+        values = extract(item, EDUCATION_FIELDS, report, 'education')
+        if values is None:
+            continue
+        current_education = Education(name=values['name'], entity=values['entity'], id=len(profile.education))
+        current_education.set_time(values['time'])
+        profile.education.append(current_education)
+    return profile
+
+
+def extract_projects(html: str, profile: Profile, report: ExtractionReport) -> Profile:
+    for item in list_items(html, report, 'projects'):
+        values = extract(item, PROJECT_FIELDS, report, 'projects')
+        if values is None:
+            continue
+        profile.projects.append(Project(len(profile.projects), **values))
+    return profile
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from scraper.linkedin import Linkedin
+from scraper.models import ScrapeJob
+
+
+def enqueue_scrape(user: User, cookie: str, sections: list = None) -> ScrapeJob:
+    """Queue a scrape for the user, an already pending or running job is returned instead of a new one."""
+    job = ScrapeJob.objects.filter(user=user, status__in=ScrapeJob.ACTIVE).first()
+    if job:
+        return job
+    try:
+        with transaction.atomic():
+            return ScrapeJob.objects.create(user=user, cookie=cookie, sections=sections)
+    except IntegrityError:
+        # a concurrent request queued one first, the unique constraint rejected this one
+        return ScrapeJob.objects.get(user=user, status__in=ScrapeJob.ACTIVE)
+
+
+def claim_next_job():
+    """Atomically move the oldest pending job of a user without a running job to running."""
+    busy_users = ScrapeJob.objects.filter(status=ScrapeJob.RUNNING).values('user_id')
+    candidates = ScrapeJob.objects.filter(status=ScrapeJob.PENDING).exclude(user_id__in=busy_users).order_by('created_at')
+
+    for job in candidates[:10]:
+        claimed = ScrapeJob.objects.filter(pk=job.pk, status=ScrapeJob.PENDING).update(
+            status=ScrapeJob.RUNNING, started_at=timezone.now()
+        )
+        if claimed:
+            job.refresh_from_db()
+            return job
+    return None
+
+
+def fail_stale_jobs() -> int:
+    """Running jobs older than SCRAPER_JOB_TIMEOUT belong to a worker that died, mark them failed."""
+    timeout = getattr(settings, 'SCRAPER_JOB_TIMEOUT', 3600)
+    return ScrapeJob.objects.filter(
+        status=ScrapeJob.RUNNING,
+        started_at__lt=timezone.now() - timedelta(seconds=timeout)
+    ).update(status=ScrapeJob.FAILED, cookie='', message='Worker timed out', finished_at=timezone.now())
+
+
+def run_job(job: ScrapeJob):
+    def progress(percent):
+        ScrapeJob.objects.filter(pk=job.pk).update(progress=percent)
+
+    status, message = ScrapeJob.FAILED, ''
+    try:
+        result = Linkedin.get_profile_data(job.cookie, job.user, sections=job.sections, progress=progress)
+        if result is True:
+            status = ScrapeJob.DONE
+        else:
+            message = result[1]
+    except Exception as e:
+        message = str(e)
+    finally:
+        update = {'status': status, 'message': message, 'cookie': '', 'finished_at': timezone.now()}
+        if status == ScrapeJob.DONE:
+            update['progress'] = 100
+        ScrapeJob.objects.filter(pk=job.pk).update(**update)
+        close_old_connections()
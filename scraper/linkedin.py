@@ -1,336 +1,341 @@
-from selenium import webdriver
 from bs4 import BeautifulSoup
-from selenium.webdriver.chrome.service import Service
 from scraper.Domain import Profile
-from scraper.Domain import License, Experience, Education, Project
+from scraper import extraction
+from scraper.extraction import ExtractionReport
 from scraper.models import UserProfileHtml
+from scraper import snapshots
+from scraper.driver_pool import DriverPoolExhausted, PooledDriver, get_driver_pool
 from django.contrib.auth.models import User
+from django.conf import settings
+from django.utils import timezone
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
+from collections import namedtuple
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import time
-import copy
-import re
+
+
+Section = namedtuple('Section', ['name', 'path', 'parser', 'scroll', 'selector', 'ready'])
 
 
 class Linkedin:
-    @staticmethod
-    def scroll(driver):
-        start = time.time()
+    # adaptive scrolling: stop once the page height and the number of list
+    # items have not changed for SCROLL_STABLE_WINDOW seconds, never run
+    # longer than SCROLL_MAX_TIME seconds
+    SCROLL_STABLE_WINDOW = 1.5
+    SCROLL_MAX_TIME = 20
+    SCROLL_INTERVAL = 0.1
+    # detail pages loaded after the main profile page, `path` is relative to
+    # /in/<username>/, `selector` is the subtree handed to the parser and
+    # `ready` the element that tells the page has rendered
+    SECTIONS = [
+        Section('contact', 'overlay/contact-info/', 'get_contact_info', False, '.artdeco-modal',
+                '.artdeco-modal'),
+        Section('certifications', 'details/certifications/', 'get_certifications', True, 'ul.pvs-list',
+                'ul.pvs-list, .artdeco-empty-state'),
+        Section('experience', 'details/experience/', 'get_experience', True, 'ul.pvs-list',
+                'ul.pvs-list, .artdeco-empty-state'),
+        Section('education', 'details/education/', 'get_education', True, 'ul.pvs-list',
+                'ul.pvs-list, .artdeco-empty-state'),
+        Section('projects', 'details/projects/', 'get_projects', True, 'ul.pvs-list',
+                'ul.pvs-list, .artdeco-empty-state'),
+    ]
+    GENERAL_SELECTOR = 'main'
+    GENERAL_READY = 'main h1'
+    FEED_READY = 'div.feed-identity-module__actor-meta'
+
+    # outerHTML of the first element matching arguments[0], the whole document
+    # when nothing matches so the parsers still see the page
+    CAPTURE_SCRIPT = """
+        var element = document.querySelector(arguments[0]) || document.documentElement;
+        return element.outerHTML;
+    """
+    FEED_IDENTITY_SCRIPT = """
+        var meta = document.querySelector('div.feed-identity-module__actor-meta');
+        return [
+            document.head.children.length === 0 && document.body.children.length === 0,
+            meta ? meta.outerHTML : null
+        ];
+    """
+
+    SCROLL_STATE_SCRIPT = """
+        window.scrollTo(0, document.body.scrollHeight);
+        return [
+            document.body.scrollHeight,
+            document.querySelectorAll('li.pvs-list__paged-list-item').length
+        ];
+    """
 
-        initialScroll = 0
-        finalScroll = 1000
+    @staticmethod
+    def scroll_until_stable(driver, stable_window: float = None, max_time: float = None) -> tuple:
+        """
+        Scroll to the bottom until the lazy loaded content stops growing.
+        Returns a tuple with the number of scroll iterations and the elapsed milliseconds.
+        """
+        stable_window = Linkedin.SCROLL_STABLE_WINDOW if stable_window is None else stable_window
+        max_time = Linkedin.SCROLL_MAX_TIME if max_time is None else max_time
+
+        start = time.monotonic()
+        last_change = start
+        last_state = None
+        iterations = 0
 
         while True:
-            driver.execute_script(f"window.scrollTo({initialScroll},{finalScroll})")
-            finalScroll += 1000
-            time.sleep(0.1)
-            end = time.time()
-            if round(end - start) > 20:
+            state = driver.execute_script(Linkedin.SCROLL_STATE_SCRIPT)
+            iterations += 1
+            now = time.monotonic()
+
+            if state != last_state:
+                last_state = state
+                last_change = now
+            elif now - last_change >= stable_window:
                 break
 
+            if now - start >= max_time:
+                break
+
+            time.sleep(Linkedin.SCROLL_INTERVAL)
+
+        return iterations, round((time.monotonic() - start) * 1000)
+
+    @staticmethod
+    def capture(driver, selector: str) -> str:
+        """Serialize only the subtree the parsers need instead of the whole page_source."""
+        return driver.execute_script(Linkedin.CAPTURE_SCRIPT, selector)
+
     @staticmethod
     def login_with_cookie(driver, cookie):
+        # pooled browsers are shared between users, drop every cookie and the
+        # site storage the previous account left behind before logging in
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+            'origin': 'https://www.linkedin.com',
+            'storageTypes': 'all',
+        })
         driver.get("https://www.linkedin.com/login")
+        driver.delete_all_cookies()
         driver.add_cookie({
             "name": "li_at",
             "value": cookie
         })
 
     @staticmethod
-    def get_general_info(html: str) -> Profile:
-        soup = BeautifulSoup(html, 'lxml')
-        name = soup.find(
-            'h1', {'class': 'text-heading-xlarge inline t-24 v-align-middle break-words'}).get_text().strip()
-        try:
-            title = soup.find('div', {'class': 'text-body-medium break-words'}).get_text().strip()
-        except:
-            title = ''
-
-        try:
-            description = soup.find('div', {
-                'class': 'pv-shared-text-with-see-more full-width t-14 t-normal t-black display-flex align-items-center'}).find('span').get_text().strip()
-        except:
-            description = ''
-
-        try:
-            location = soup.find(
-                'span', {'class': 'text-body-small inline t-black--light break-words'}).get_text().strip()
-        except:
-            location = ''
-        return copy.deepcopy(Profile(name=name, title=title, description=description, location=location))
+    def get_general_info(html: str, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_general(html, report if report is not None else ExtractionReport())
 
     @staticmethod
-    def get_contact_info(html: str, profile: Profile):
-        soup = BeautifulSoup(html, 'lxml')
-        email_r = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b'
+    def get_contact_info(html: str, profile: Profile, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_contact(html, profile, report if report is not None else ExtractionReport())
 
-        try:
-            profile.phone_number = soup.find(
-                'li', {'class': 'pv-contact-info__ci-container t-14'}).find('span').get_text().strip()
-        except:
-            profile.phone_number = ''
-        try:
-            datas = soup.find_all(
-                'div', {'class': 'pv-contact-info__ci-container t-14'})
-            profile.email = ''
-            for i in datas:
-                current = i.find('a').get_text().strip()
-                if (re.fullmatch(email_r, current)):
-                    profile.email = current
-                    break
-        except:
-            profile.email = ''
-        try:
-            profile.web_page = soup.find(
-                'li', {'class': 'pv-contact-info__ci-container link t-14'}).find('a').get_text().strip()
-        except:
-            profile.web_page = ''
+    @staticmethod
+    def get_certifications(html: str, profile: Profile, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_certifications(html, profile, report if report is not None else ExtractionReport())
 
-        return profile
+    @staticmethod
+    def get_experience(html: str, profile: Profile, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_experience(html, profile, report if report is not None else ExtractionReport())
 
     @staticmethod
-    def get_certifications(html: str, profile: Profile) -> Profile:
-        soup = BeautifulSoup(html, 'lxml')
-        id = 0
+    def get_education(html: str, profile: Profile, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_education(html, profile, report if report is not None else ExtractionReport())
 
-        try:
-            list_off_licenses = soup.find(
-                'ul',
-                {'class': 'pvs-list'}
-            ).find_all('li', {'class', 'pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column'})
-        except:
-            profile.licences = []
-
-        for i in list_off_licenses:
-            try:
-                name = i.find(
-                    'div',
-                    {'class': 'display-flex align-items-center mr1 hoverable-link-text t-bold'}
-                ).find('span').get_text().strip()
+    @staticmethod
+    def get_projects(html: str, profile: Profile, report: ExtractionReport = None) -> Profile:
+        return extraction.extract_projects(html, profile, report if report is not None else ExtractionReport())
 
-                try:
-                    emitted_by = i.find('span', {'class': 't-14 t-normal'}).find('span').get_text().strip()
-                except:
-                    emitted_by = ''
+    @staticmethod
+    def select_lenguage(driver, lenguage_to_pick: str = 'en_US'):
+        select = Select(driver.find_element(By.ID, 'globalfooter-select_language'))
+        select.select_by_value(lenguage_to_pick)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
 
-                try:
-                    expedition = i.find('span', {'class': 't-14 t-normal t-black--light'}
-                                        ).find('span').get_text().strip().split(':')[-1].strip()
-                except:
-                    expedition = ''
-
-                c_license = License(
-                    id=id,
-                    name=name,
-                    emitted_by=emitted_by,
-                    expedition=expedition
-                )
-                profile.licences.append(c_license)
-                id += 1
-            except:
-                continue
-
-        return profile
+        return lenguage_to_pick
 
     @staticmethod
-    def get_experience(html: str, profile: Profile) -> Profile:
-        soup = BeautifulSoup(html, 'lxml')
-        id = 0
-
+    def wait_ready(driver, selector: str, timeout: float = 10) -> bool:
+        """
+        Wait for the element that shows the page content has rendered. With the eager
+        page load strategy driver.get returns as soon as the DOM is parsed.
+        """
         try:
-            list_off_experiences = soup.find(
-                'ul',
-                {'class': 'pvs-list'}
-            ).find_all('li', {'class', 'pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column'})
-        except:
-            profile.experiences = []
-
-        for i in list_off_experiences:
-            try:
-                name = i.find(
-                    'div', {'class': 'display-flex align-items-center mr1 hoverable-link-text t-bold'}).find('span').get_text().strip()
-            except:
-                try:
-                    name = i.find('div', {'class': 'display-flex align-items-center mr1 t-bold'}
-                                  ).find('span').get_text().strip()
-                except:
-                    continue
-
-            current_experience = Experience(name=name, id=id)
-
-            try:
-                # group of experiences
-                group = i.find('ul', {'class': 'pvs-list'})
-                elemets = group.find_all('li', {'class': 'pvs-list__paged-list-item pvs-list__item--one-column'})
-                temp_id = 0
-                for j in elemets:
-                    element_name = j.find(
-                        'div', {'class': 'display-flex align-items-center mr1 hoverable-link-text t-bold'}).find('span').get_text().strip()
-
-                    try:
-                        element_time = j.find('span', {'class': 't-14 t-normal t-black--light'}
-                                              ).find('span').get_text().strip()
-                    except:
-                        element_time = ''
-
-                    try:
-                        element_description = j.find(
-                            'div', {'class': 'display-flex align-items-center t-14 t-normal t-black'}).find('span').get_text().strip()
-                    except:
-                        element_description = ''
-
-                    sub_exprecience = Experience(id=temp_id, name=element_name,
-                                                 time=element_time, description=element_description)
-                    sub_exprecience.group = None
-                    current_experience.group.append(sub_exprecience)
-                    temp_id += 1
-            except:
-                current_experience.group = None
-
-            if not current_experience.group:
-                try:
-                    time = i.find('span', {'class': 't-14 t-normal t-black--light'}).find('span').get_text().strip()
-                except:
-                    time = ''
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except TimeoutException:
+            return False
 
-                current_experience.time = time
+    @staticmethod
+    def fetch_section(driver, username: str, section: Section) -> str:
+        driver.get(f'https://www.linkedin.com/in/{username}/{section.path}')
+        if not Linkedin.wait_ready(driver, section.ready):
+            print(f'[Extracting::{username}] {section.name.capitalize()} did not render in time')
+        if section.scroll:
+            iterations, elapsed = Linkedin.scroll_until_stable(driver)
+            print(f'[Extracting::{username}] {section.name.capitalize()} scrolled in {iterations} iterations ({elapsed} ms)')
+        return Linkedin.capture(driver, section.selector)
 
+    @staticmethod
+    def fetch_sections(driver, cookie: str, username: str, sections: list, workers: int = 1) -> dict:
+        """
+        Load every section page and return its html keyed by section name.
+        With more than one worker, extra drivers are leased from the pool and the
+        sections are fetched concurrently; the given driver always takes part.
+        """
+        pending = queue.Queue()
+        for section in sections:
+            pending.put(section)
+
+        html = {}
+
+        def drain(current_driver):
+            while True:
                 try:
-                    element_description = i.find(
-                        'div', {'class': 'display-flex align-items-center t-14 t-normal t-black'}).find('span').get_text().strip()
-                except:
-                    element_description = ''
-
-                current_experience.description = element_description
-
-            profile.experiences.append(current_experience)
+                    section = pending.get_nowait()
+                except queue.Empty:
+                    return
+                html[section.name] = Linkedin.fetch_section(current_driver, username, section)
 
-            id += 1
-
-        return profile
+        def leased_worker():
+            try:
+                with get_driver_pool().lease(timeout=0) as pooled:
+                    if pooled.cookie != cookie:
+                        Linkedin.login_with_cookie(pooled.driver, cookie)
+                        pooled.cookie = cookie
+                    drain(pooled.driver)
+            except DriverPoolExhausted:
+                # no spare driver right now, the other workers pick up the sections
+                return
+
+        extra = min(workers, len(sections)) - 1
+        with ThreadPoolExecutor(max_workers=max(extra, 1)) as executor:
+            futures = [executor.submit(leased_worker) for _ in range(extra)]
+            drain(driver)
+            for future in futures:
+                future.result()
+
+        return html
 
     @staticmethod
-    def get_education(html: str, profile: Profile) -> Profile:
-        soup = BeautifulSoup(html, 'lxml')
+    def parse_profile(html: dict, report: ExtractionReport = None) -> dict:
+        """Build the serialized profile from the html of the general page and every section."""
+        report = report if report is not None else ExtractionReport()
+        profile = Linkedin.get_general_info(html['general'], report)
+        for section in Linkedin.SECTIONS:
+            profile = getattr(Linkedin, section.parser)(html.get(section.name, ''), profile, report)
+        return profile.serrialize()
 
+    @staticmethod
+    def save_profile(user: User, profile: dict, sections: dict = None) -> UserProfileHtml:
+        """
+        Store the serialized profile and the freshness of the sections just fetched.
+        When the profile did not change only the section metadata is written, if anything.
+        """
         try:
-            list_off_education = soup.find(
-                'ul',
-                {'class': 'pvs-list'}
-            ).find_all('li', {'class', 'pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column'})
-        except:
-            profile.education = []
-
-        id = 0
-        for i in list_off_education:
-            try:
-                name = i.find(
-                    'div',
-                    {'class': 'display-flex align-items-center mr1 hoverable-link-text t-bold'}
-                ).find('span').get_text().strip()
-            except:
-                continue
-
-            try:
-                entity = i.find(
-                    'span',
-                    {'class': 't-14 t-normal'}
-                ).find('span').get_text().strip()
-            except:
-                entity = ''
+            user_profile = UserProfileHtml.objects.get(
+                user=user
+            )
+        except UserProfileHtml.DoesNotExist:
+            user_profile = UserProfileHtml(
+                user=user,
+                data=profile,
+                sections=sections or {}
+            )
+            user_profile.save()
+            return user_profile
 
-            try:
-                time = i.find(
-                    'span',
-                    {'class': 't-14 t-normal t-black--light'}
-                ).find('span').get_text().strip()
-            except:
-                time = ''
+        merged = {**user_profile.sections, **(sections or {})}
 
-            current_education = Education(name=name, entity=entity, id=id)
-            current_education.set_time(time)
+        if user_profile.data == profile:
+            if merged != user_profile.sections:
+                user_profile.sections = merged
+                UserProfileHtml.objects.filter(pk=user_profile.pk).update(sections=merged)
+            return user_profile
 
-            profile.education.append(current_education)
-            id += 1
-        return profile
+        user_profile.data = profile
+        user_profile.sections = merged
+        user_profile.save()
+        return user_profile
 
     @staticmethod
-    def get_projects(html: str, profile: Profile) -> Profile:
-        soup = BeautifulSoup(html, 'lxml')
-
-        try:
-            list_off_projects = soup.find(
-                'ul',
-                {'class': 'pvs-list'}
-            ).find_all('li', {'class', 'pvs-list__paged-list-item artdeco-list__item pvs-list__item--line-separated pvs-list__item--one-column'})
-        except:
-            profile.projects = []
-
-        id = 0
-        for i in list_off_projects:
-            name = i.find('div', {'class': 'display-flex align-items-center mr1 t-bold'}
-                          ).find('span').get_text().strip()
-            time = i.find('span', {'class': 't-14 t-normal'}).find('span').get_text().strip()
-
-            try:
-                description = i.find(
-                    'div', {'class': 'display-flex align-items-center t-14 t-normal t-black'}).find('span').get_text().strip()
-            except:
-                description = ''
-
-            profile.projects.append(Project(id, name, time, description))
-            id += 1
+    def section_names() -> list:
+        return ['general'] + [section.name for section in Linkedin.SECTIONS]
 
-        return profile
+    @staticmethod
+    def stale_sections(user_profile: UserProfileHtml, requested: list = None, max_age: int = None) -> set:
+        """Sections explicitly requested plus the ones never fetched or fetched more than max_age seconds ago."""
+        if user_profile is None:
+            return set(Linkedin.section_names())
+
+        if max_age is None:
+            max_age = getattr(settings, 'SCRAPER_SECTION_MAX_AGE', 86400)
+
+        oldest = timezone.now() - timedelta(seconds=max_age)
+        stale = set(requested or [])
+        for name in Linkedin.section_names():
+            meta = user_profile.sections.get(name)
+            if not meta or datetime.fromisoformat(meta['fetched_at']) < oldest:
+                stale.add(name)
+        return stale
 
     @staticmethod
-    def select_lenguage(driver, lenguage_to_pick: str = 'en_US'):
-        select = Select(driver.find_element(By.ID, 'globalfooter-select_language'))
-        select.select_by_value(lenguage_to_pick)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+    def get_profile_data(cookie: str, user: User, only_check: bool = False, just_li: bool = False,
+                         section_workers: int = None, sections: list = None, max_age: int = None,
+                         progress=None) -> bool:
+        """
+        Scrape the profile of the LinkedIn account behind the cookie into UserProfileHtml.
+        Only `sections` and the sections older than `max_age` seconds are fetched again,
+        the others are parsed from their stored snapshots.
+        `progress` is called with the completion percentage as the scrape goes on.
+        """
+        if section_workers is None:
+            section_workers = getattr(settings, 'SCRAPER_SECTION_WORKERS', 1)
+
+        refresh = Linkedin.stale_sections(UserProfileHtml.objects.filter(user=user).first(), sections, max_age)
+        if not refresh and not (only_check or just_li):
+            print(f'[Extracting] {user.username} is up to date')
+            return True
 
-        return lenguage_to_pick
+        with get_driver_pool().lease() as pooled:
+            return Linkedin.extract_profile_data(pooled, cookie, user, only_check, just_li, section_workers, refresh, progress)
 
     @staticmethod
-    def get_profile_data(cookie: str, user: User, only_check: bool = False, just_li: bool = False) -> bool:
-        service = Service(executable_path=r'/usr/local/bin/chromedriver')
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-        Linkedin.login_with_cookie(driver, cookie)
+    def extract_profile_data(pooled: PooledDriver, cookie: str, user: User, only_check: bool = False, just_li: bool = False,
+                             section_workers: int = 1, refresh: set = None, progress=None) -> bool:
+        driver = pooled.driver
+        progress = progress or (lambda percent: None)
+
+        # leased drivers keep their session, only log in when the cookie changes
+        if pooled.cookie != cookie:
+            Linkedin.login_with_cookie(driver, cookie)
+            pooled.cookie = cookie
 
         print(f'[Extracting] info cookie: {cookie} with user {user.username}')
 
         driver.get(f'https://www.linkedin.com/feed/')
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        Linkedin.wait_ready(driver, Linkedin.FEED_READY)
+
+        empty_page, identity = driver.execute_script(Linkedin.FEED_IDENTITY_SCRIPT)
 
-        if len(driver.page_source) == 39:
+        if empty_page:
+            pooled.cookie = None
             return False, "Ah, it appears there's a slight hiccup with your Token!"
 
-        username = BeautifulSoup(driver.page_source, 'lxml').find(
+        username = BeautifulSoup(identity, 'lxml').find(
             'div', {'class', 'feed-identity-module__actor-meta break-words'}).find('a', href=True)['href'].replace('/in/', '')[0:-1]
 
         print(f'[Extracting] LinkedIn username: {username}')
+        progress(10)
 
         driver.get(f'https://www.linkedin.com/in/{username}/')
-
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        Linkedin.wait_ready(driver, Linkedin.GENERAL_READY)
 
         if just_li:
             return True
@@ -341,73 +346,41 @@ class Linkedin:
         if only_check:
             return True
 
-        Linkedin.scroll(driver)
-
-        print(f'[Extracting] Selection lenguage {Linkedin.select_lenguage(driver)}')
-
-        profile = Linkedin.get_general_info(driver.page_source)
+        # sections without a stored snapshot have to be fetched whatever their metadata says
+        stored = snapshots.latest_snapshots(user)
+        if refresh is None:
+            refresh = set(Linkedin.section_names())
+        refresh = set(refresh) | (set(Linkedin.section_names()) - stored.keys())
+        print(f'[Extracting::{username}] Refreshing {", ".join(sorted(refresh))}')
+        progress(20)
 
-        print(f'[Extracting::{username}] General info loaded')
+        html = {}
+        if 'general' in refresh:
+            iterations, elapsed = Linkedin.scroll_until_stable(driver)
+            print(f'[Extracting::{username}] Profile scrolled in {iterations} iterations ({elapsed} ms)')
 
-        driver.get(f'https://www.linkedin.com/in/{username}/overlay/contact-info/')
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        profile = Linkedin.get_contact_info(driver.page_source, profile)
-
-        print(f'[Extracting::{username}] General contact info loaded')
-
-        driver.get(f'https://www.linkedin.com/in/{username}/details/certifications/')
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        Linkedin.scroll(driver)
-        profile = Linkedin.get_certifications(driver.page_source, profile)
-
-        print(f'[Extracting::{username}] General certifications info loaded')
-
-        driver.get(f'https://www.linkedin.com/in/{username}/details/experience/')
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        Linkedin.scroll(driver)
-        profile = Linkedin.get_experience(driver.page_source, profile)
-
-        print(f'[Extracting::{username}] General experience info loaded')
+        print(f'[Extracting] Selection lenguage {Linkedin.select_lenguage(driver)}')
 
-        driver.get(f'https://www.linkedin.com/in/{username}/details/education/')
+        if 'general' in refresh:
+            html['general'] = Linkedin.capture(driver, Linkedin.GENERAL_SELECTOR)
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        sections = [section for section in Linkedin.SECTIONS if section.name in refresh]
+        html.update(Linkedin.fetch_sections(driver, cookie, username, sections, workers=section_workers))
+        progress(80)
 
-        Linkedin.scroll(driver)
-        profile = Linkedin.get_education(driver.page_source, profile)
+        freshness = {}
+        for section, section_html in html.items():
+            snapshot = snapshots.store_snapshot(user, section, section_html)
+            freshness[section] = {'hash': snapshot.blob_id, 'fetched_at': snapshot.taken_at.isoformat()}
 
-        print(f'[Extracting::{username}] General education info loaded')
-
-        driver.get(f'https://www.linkedin.com/in/{username}/details/projects/')
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        Linkedin.scroll(driver)
-        profile = Linkedin.get_projects(driver.page_source, profile)
+        report = ExtractionReport()
+        profile = Linkedin.parse_profile({**stored, **html}, report)
+        print(f'[Extracting::{username}] Profile parsed')
+        progress(90)
 
-        print(f'[Extracting::{username}] General projects info loaded')
+        if report:
+            print(f'[Extracting::{username}] Fields left to defaults: {report.serrialize()}')
 
-        driver.close()
-        profile = profile.serrialize()
-        try:
-            user = UserProfileHtml.objects.get(
-                user=user
-            )
-            user.data = profile
-            user.save()
-        except UserProfileHtml.DoesNotExist:
-            user = UserProfileHtml(
-                user=user,
-                data=profile
-            )
-            user.save()
+        Linkedin.save_profile(user, profile, freshness)
 
         return True
\ No newline at end of file
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from scraper.benchmarks import parsers
+
+
+class Command(BaseCommand):
+    help = 'Replay the saved LinkedIn html fixtures through the parsers, without Selenium'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200, help='Parses per page for the throughput figures')
+        parser.add_argument('--update-golden', action='store_true', help='Rewrite golden.json from the current parsers')
+
+    def handle(self, *args, **options):
+        results = parsers.run(repeat=options['repeat'], update_golden=options['update_golden'])
+
+        failed = False
+        for result in results:
+            self.stdout.write(f"[{result['fixture']}]")
+            for timing in result['timings']:
+                self.stdout.write(
+                    f"  {timing['parser']:<20} {timing['pages_per_second']:>10.1f} pages/s"
+                    f" {timing['mb_per_second']:>8.2f} MB/s {timing['peak_kb']:>10.1f} KB peak"
+                )
+
+            self.stdout.write(f"  defaults: {result['report']}")
+
+            for field, expected, actual in result['differences']:
+                failed = True
+                self.stdout.write(self.style.ERROR(f'  {field}: expected {expected!r}, got {actual!r}'))
+
+        if failed:
+            raise CommandError('Parsed profiles differ from golden.json')
+        self.stdout.write(self.style.SUCCESS('All fixtures match golden.json'))
@@ -0,0 +1,46 @@
+import os
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from scraper.models import UserProfileHtml
+from services.pdf_service import export_profile_pdfs
+
+
+class Command(BaseCommand):
+    help = 'Render the stored LinkedIn profiles as CV PDFs on a process pool, into a directory or a zip'
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*', help='Only these users (default: every scraped profile)')
+        parser.add_argument('--output-dir', help='Write one <username>_CV.pdf per profile here')
+        parser.add_argument('--zip', help='Write a zip archive to this path, "-" streams it to stdout')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Rendering processes')
+
+    def handle(self, *args, **options):
+        if bool(options['output_dir']) == bool(options['zip']):
+            raise CommandError('Pass exactly one of --output-dir or --zip')
+
+        profiles = UserProfileHtml.objects.select_related('user').order_by('user__username')
+        if options['usernames']:
+            profiles = profiles.filter(user__username__in=options['usernames'])
+        pairs = ((profile.user.username, profile.data) for profile in profiles.iterator())
+
+        # progress goes to stderr when the archive itself is streamed to stdout
+        log = self.stderr if options['zip'] == '-' else self.stdout
+
+        exported = 0
+        if options['zip']:
+            output = sys.stdout.buffer if options['zip'] == '-' else open(options['zip'], 'wb')
+            try:
+                for filename in export_profile_pdfs(pairs, zip_file=output, workers=options['workers']):
+                    exported += 1
+                    log.write(f'  {filename}')
+            finally:
+                if output is not sys.stdout.buffer:
+                    output.close()
+        else:
+            for filename in export_profile_pdfs(pairs, directory=options['output_dir'], workers=options['workers']):
+                exported += 1
+                log.write(f'  {filename}')
+
+        log.write(self.style.SUCCESS(f'Exported {exported} CVs'))
@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from scraper.extraction import ExtractionReport
+from scraper.linkedin import Linkedin
+from scraper.snapshots import latest_snapshots
+
+
+class Command(BaseCommand):
+    help = 'Rebuild UserProfileHtml.data from the stored html snapshots, without a browser'
+
+    def add_arguments(self, parser):
+        parser.add_argument('usernames', nargs='*', help='Only these users (default: every user with snapshots)')
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(html_snapshots__isnull=False).distinct()
+        if options['usernames']:
+            users = users.filter(username__in=options['usernames'])
+
+        rebuilt = 0
+        for user in users.iterator():
+            html = latest_snapshots(user)
+            if 'general' not in html:
+                self.stdout.write(self.style.WARNING(f'[{user.username}] no general snapshot, skipped'))
+                continue
+
+            report = ExtractionReport()
+            Linkedin.save_profile(user, Linkedin.parse_profile(html, report))
+            rebuilt += 1
+
+            if report:
+                self.stdout.write(f'[{user.username}] fields left to defaults: {report.serrialize()}')
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rebuilt} profiles'))
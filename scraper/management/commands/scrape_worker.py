@@ -0,0 +1,52 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from scraper.driver_pool import get_driver_pool
+from scraper.jobs import claim_next_job, fail_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = 'Run queued LinkedIn scrape jobs with bounded concurrency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=getattr(settings, 'SCRAPER_WORKER_CONCURRENCY', 2))
+        parser.add_argument('--poll', type=float, default=2.0, help='Seconds between polls of an idle queue')
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is drained')
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+
+        failed = fail_stale_jobs()
+        if failed:
+            self.stdout.write(self.style.WARNING(f'Marked {failed} stale running jobs as failed'))
+
+        # Pay the Chrome cold start here rather than on the first job of every slot
+        pool = get_driver_pool()
+        try:
+            pool.warm(concurrency)
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f'Could not pre-launch chrome drivers: {e}'))
+        else:
+            self.stdout.write(f'Pre-launched {min(concurrency, pool.size)} chrome drivers')
+
+        self.stdout.write(f'Scrape worker started with concurrency {concurrency}')
+        running = set()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                while True:
+                    running = {future for future in running if not future.done()}
+
+                    job = claim_next_job() if len(running) < concurrency else None
+                    if job:
+                        self.stdout.write(f'[Job {job.pk}] scraping {job.user.username}')
+                        running.add(executor.submit(run_job, job))
+                        continue
+
+                    if options['once'] and not running:
+                        break
+                    time.sleep(options['poll'])
+            except KeyboardInterrupt:
+                self.stdout.write('Stopping, waiting for running jobs to finish')
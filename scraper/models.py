@@ -5,4 +5,71 @@ from django.contrib.auth.models import User
 class UserProfileHtml(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     data = models.JSONField()
+    # {section: {'hash': sha256 of the captured html, 'fetched_at': iso datetime}}
+    sections = models.JSONField(default=dict)
     last_modified = models.DateTimeField(auto_now=True, editable=False, null=False, blank=False)
+
+
+class HtmlBlob(models.Model):
+    """zlib compressed html, addressed by the sha256 of the uncompressed text"""
+    digest = models.CharField(max_length=64, primary_key=True)
+    data = models.BinaryField()
+    size = models.PositiveIntegerField()
+
+
+class HtmlSnapshot(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='html_snapshots')
+    section = models.CharField(max_length=32)
+    blob = models.ForeignKey(HtmlBlob, on_delete=models.PROTECT, related_name='snapshots')
+    taken_at = models.DateTimeField(auto_now_add=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'section', '-taken_at']),
+        ]
+
+
+class ScrapeJob(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+    ACTIVE = [PENDING, RUNNING]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='scrape_jobs')
+    # li_at cookie used for the scrape, wiped once the job is over
+    cookie = models.TextField(blank=True)
+    sections = models.JSONField(null=True, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING, db_index=True)
+    progress = models.PositiveSmallIntegerField(default=0)
+    message = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, editable=False)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # at most one pending or running job per user, enforced by the database
+            models.UniqueConstraint(
+                fields=['user'],
+                condition=models.Q(status__in=['pending', 'running']),
+                name='one_active_scrape_job_per_user',
+            ),
+        ]
+
+    def serrialize(self):
+        return {
+            'id': self.pk,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -0,0 +1,32 @@
+import hashlib
+import zlib
+
+from django.contrib.auth.models import User
+
+from scraper.models import HtmlBlob, HtmlSnapshot
+
+
+def store_snapshot(user: User, section: str, html: str) -> HtmlSnapshot:
+    """Persist the captured html of a section, identical captures share the same blob."""
+    raw = html.encode('utf-8')
+    digest = hashlib.sha256(raw).hexdigest()
+
+    blob, _ = HtmlBlob.objects.get_or_create(
+        digest=digest,
+        defaults={'data': zlib.compress(raw, 9), 'size': len(raw)}
+    )
+    return HtmlSnapshot.objects.create(user=user, section=section, blob=blob)
+
+
+def read_blob(blob: HtmlBlob) -> str:
+    return zlib.decompress(bytes(blob.data)).decode('utf-8')
+
+
+def latest_snapshots(user: User) -> dict:
+    """html of the newest snapshot of every section stored for the user, keyed by section"""
+    html = {}
+    snapshots = HtmlSnapshot.objects.filter(user=user).select_related('blob').order_by('section', '-taken_at')
+    for snapshot in snapshots:
+        if snapshot.section not in html:
+            html[snapshot.section] = read_blob(snapshot.blob)
+    return html
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import scrape_jobs, scrape_job_status
+
+urlpatterns = [
+    path("api/scrape-jobs/", scrape_jobs, name="scrape_jobs"),
+    path("api/scrape-jobs/<int:job_id>/", scrape_job_status, name="scrape_job_status"),
+]
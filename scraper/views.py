@@ -0,0 +1,50 @@
+import json
+
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.http import require_GET, require_POST
+
+from scraper.jobs import enqueue_scrape
+from scraper.linkedin import Linkedin
+from scraper.models import ScrapeJob
+
+
+@require_POST
+def scrape_jobs(request):
+    """Queue a LinkedIn scrape for the logged in user, the client then polls the job status"""
+    if not request.user.is_authenticated:
+        return JsonResponse({"success": False, "error": "Authentication required"}, status=401)
+
+    try:
+        payload = json.loads(request.body or "{}")
+    except ValueError:
+        # JSONDecodeError, and UnicodeDecodeError for bodies that are not utf-8
+        return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({"success": False, "error": "Expected a JSON object"}, status=400)
+
+    cookie = payload.get("cookie")
+    if not cookie or not isinstance(cookie, str):
+        return JsonResponse({"success": False, "error": "cookie is required"}, status=400)
+
+    sections = payload.get("sections")
+    if sections is not None and (
+        not isinstance(sections, list)
+        or not all(isinstance(name, str) and name in Linkedin.section_names() for name in sections)
+    ):
+        return JsonResponse(
+            {"success": False, "error": f"sections must be a list of {', '.join(Linkedin.section_names())}"},
+            status=400,
+        )
+
+    job = enqueue_scrape(request.user, cookie, sections)
+    return JsonResponse({"success": True, "data": job.serrialize()}, status=202)
+
+
+@require_GET
+def scrape_job_status(request, job_id):
+    if not request.user.is_authenticated:
+        return JsonResponse({"success": False, "error": "Authentication required"}, status=401)
+
+    job = get_object_or_404(ScrapeJob, pk=job_id, user=request.user)
+    return JsonResponse({"success": True, "data": job.serrialize()})
@@ -0,0 +1,118 @@
+"""
+Offline check that the REST and GraphQL GitHub backends agree.
+
+Both backends are pointed at a local stub serving the canned responses under
+fixtures/github, which describe the same account, and their comprehensive
+stats are compared field by field in both language modes.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+from django.test.utils import override_settings
+
+from services.github_service import GitHubGraphQLService, GitHubService
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "github"
+USERNAME = "ada-check"
+
+
+def load_fixture(name):
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text())
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers the REST endpoints and the GraphQL query of USERNAME"""
+
+    def do_GET(self):
+        path = urlparse(self.path).path.strip("/").split("/")
+        if path == ["users", USERNAME]:
+            return self._reply(load_fixture("rest_user"))
+        if path == ["users", USERNAME, "repos"]:
+            return self._reply(load_fixture("rest_repos"))
+        if path == ["users", USERNAME, "events"]:
+            return self._reply(load_fixture("rest_events"))
+        if len(path) == 4 and path[:2] == ["repos", USERNAME] and path[3] == "languages":
+            languages = load_fixture("rest_languages")
+            if path[2] in languages:
+                return self._reply(languages[path[2]])
+        self._reply({"message": "Not Found"}, status=404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        # GitHub rejects the whole query when an ordering has no field
+        for ordering in re.findall(r"orderBy:\s*\{([^}]*)\}", body["query"]):
+            if "field:" not in ordering:
+                return self._reply({"errors": [{"message": f"orderBy {{{ordering}}} is missing field"}]})
+        if body["variables"].get("login") != USERNAME:
+            return self._reply({"data": {"user": None}})
+        self._reply({"data": {"user": load_fixture("graphql_user")}})
+
+    def _reply(self, payload, status=200):
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def flatten(value, prefix=""):
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = enumerate(value)
+    else:
+        return {prefix: value}
+
+    flat = {}
+    for key, child in items:
+        flat.update(flatten(child, f"{prefix}.{key}" if prefix else str(key)))
+    if not flat:
+        flat[prefix] = value
+    return flat
+
+
+def compare(rest, graphql):
+    """Field level differences as (field, rest, graphql) tuples"""
+    rest, graphql = flatten(rest), flatten(graphql)
+    return [
+        (field, rest.get(field, "<missing>"), graphql.get(field, "<missing>"))
+        for field in sorted(rest.keys() | graphql.keys())
+        if rest.get(field, "<missing>") != graphql.get(field, "<missing>")
+    ]
+
+
+def run():
+    """Differences per language mode, {"count": [...], "weighted": [...]}"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{server.server_port}"
+
+    results = {}
+    try:
+        for mode, weighted in (("count", False), ("weighted", True)):
+            # A private cache per mode so neither the stub data nor its rate
+            # limit leaks into the one the site serves from, or into the other mode
+            caches = {"default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": f"github-check-{mode}",
+            }}
+            with override_settings(CACHES=caches, GITHUB_WEIGHTED_LANGUAGES=weighted):
+                rest = GitHubService(username=USERNAME)
+                rest.BASE_URL = stub_url
+                graphql = GitHubGraphQLService(username=USERNAME)
+                graphql.graphql_url = f"{stub_url}/graphql"
+                results[mode] = compare(rest.get_comprehensive_stats(), graphql.get_comprehensive_stats())
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
@@ -1,5 +1,11 @@
 import requests
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import parse_qs, urlparse
+from requests.adapters import HTTPAdapter
 from django.core.cache import cache
 from django.conf import settings
 from datetime import datetime, timedelta
@@ -7,15 +13,110 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Process-wide state shared by every GitHubService instance
+_sessions = {}
+_sessions_lock = threading.Lock()
+_latency = {}
+_latency_lock = threading.Lock()
+_key_locks = {}
+_key_locks_lock = threading.Lock()
+_cache_stats = {"hit": 0, "stale": 0, "miss": 0}
+_cache_stats_lock = threading.Lock()
+_connection_slots = None
+_connection_slots_lock = threading.Lock()
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+class GitHubPageError(Exception):
+    """A page of a paginated endpoint could not be fetched"""
+
+
+class CircuitBreaker:
+    """
+    Stops calling an unhealthy upstream.
+
+    Closed: calls go through, `failure_threshold` consecutive failures open
+    the circuit. Open: calls are refused for `cooldown` seconds, then the
+    circuit turns half-open. Half-open: `half_open_probes` calls go through,
+    a success closes the circuit and a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, cooldown=30, half_open_probes=1):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def _current_state(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def allow(self):
+        """Whether a call may go upstream now, half-open probes are used up by asking"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._current_state() == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"GitHub circuit opened after {self._failures} failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
 
 class GitHubService:
     """Service to fetch GitHub profile and repository data"""
 
     BASE_URL = "https://api.github.com"
-    CACHE_TIMEOUT = 3600  # 1 hour cache
+    CACHE_TIMEOUT = 3600  # 1 hour cache (soft TTL, stale data is still served)
+    HARD_CACHE_TIMEOUT = 7 * 24 * 3600  # stale data and ETags are kept a week
+    REFRESH_LOCK_TIMEOUT = 60  # seconds a background refresh holds its lock
+    MAX_PAGES = 30  # pages followed on paginated endpoints, a warning is logged past it
+    PAGE_WORKERS = 4  # pages fetched concurrently
+    RATE_LIMIT_RESERVE = 10  # below this many requests left, background refreshes wait for the reset
+    RATE_LIMIT_RESOURCE = "core"
+    REQUEST_TIMEOUT = 10  # seconds per GitHub call
+    STATS_DEADLINE = 12  # seconds for the whole comprehensive stats fan-out
+    POOL_CONNECTIONS = 4  # keep-alive pools per session (one per host)
+    POOL_MAXSIZE = 10  # connections kept alive per host
+    MAX_RETRIES = 2  # retries on 5xx responses and connection errors
+    BACKOFF_BASE = 0.5  # seconds, doubled on every retry and jittered
 
     def __init__(self, username="zabbix-byte"):
         self.username = username
+        # Set by batch refreshes: revalidate every entry instead of serving the cache
+        self.force_refresh = False
+        # endpoint -> whether its last cache refresh got an answer from GitHub
+        self.refresh_outcomes = {}
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "CV-Django-App",
@@ -26,127 +127,481 @@ class GitHubService:
         if github_token:
             self.headers["Authorization"] = f"token {github_token}"
 
-    def _make_request(self, endpoint):
-        """Make a request to GitHub API with error handling"""
-        try:
-            url = f"{self.BASE_URL}/{endpoint}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+    def _session(self):
+        """Keep-alive session shared by every service built with the same headers"""
+        key = tuple(sorted(self.headers.items()))
+        with _sessions_lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                adapter = HTTPAdapter(
+                    pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _sessions[key] = session
+            return session
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 403:
-                logger.warning(f"GitHub API rate limit exceeded for {endpoint}")
+    def _record_latency(self, endpoint, started):
+        """Aggregate latency per endpoint, with the username and query string stripped"""
+        name = "/".join(
+            "{username}" if segment == self.username else segment
+            for segment in endpoint.split("?")[0].split("/")
+        )
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with _latency_lock:
+            stats = _latency.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    @staticmethod
+    def latency_stats():
+        """Per endpoint request count, average and max latency in milliseconds"""
+        with _latency_lock:
+            return {
+                name: {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 1),
+                    "max_ms": round(stats["max_ms"], 1),
+                }
+                for name, stats in _latency.items()
+            }
+
+    @staticmethod
+    def _connection_slots():
+        """Process-wide cap on concurrent GitHub connections (GITHUB_MAX_CONNECTIONS)"""
+        global _connection_slots
+        with _connection_slots_lock:
+            if _connection_slots is None:
+                _connection_slots = threading.BoundedSemaphore(
+                    getattr(settings, "GITHUB_MAX_CONNECTIONS", 8)
+                )
+            return _connection_slots
+
+    @staticmethod
+    def _circuit(url):
+        """Circuit breaker shared by every call to the host of `url`"""
+        host = urlparse(url).netloc
+        with _breakers_lock:
+            if host not in _breakers:
+                _breakers[host] = CircuitBreaker(
+                    failure_threshold=getattr(settings, "GITHUB_CIRCUIT_FAILURES", 5),
+                    cooldown=getattr(settings, "GITHUB_CIRCUIT_COOLDOWN", 30),
+                    half_open_probes=getattr(settings, "GITHUB_CIRCUIT_PROBES", 1),
+                )
+            return _breakers[host]
+
+    @staticmethod
+    def circuit_states():
+        """State of the circuit breaker of every GitHub host called so far"""
+        with _breakers_lock:
+            breakers = dict(_breakers)
+        return {host: breaker.state for host, breaker in breakers.items()}
+
+    def _url(self, endpoint):
+        return endpoint if endpoint.startswith("http") else f"{self.BASE_URL}/{endpoint}"
+
+    def _backoff(self, attempt):
+        time.sleep(self.BACKOFF_BASE * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    def _request(self, endpoint, headers=None, json_body=None):
+        """
+        GET an endpoint (POST `json_body` when given) through the pooled
+        session, retrying 5xx responses and connection errors with jittered
+        exponential backoff. Returns the last response, or None when the
+        request never got one. Those failures feed the host circuit breaker;
+        while it is open no request is made and None is returned right away,
+        so callers fall back to cached data.
+        """
+        if self._rate_limit_exhausted():
+            logger.warning(f"Skipping {endpoint}, GitHub rate limit exhausted until reset")
+            return None
+
+        url = self._url(endpoint)
+        session = self._session()
+        breaker = self._circuit(url)
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            if not breaker.allow():
+                logger.warning(f"Skipping {endpoint}, GitHub circuit is {breaker.state}")
                 return None
-            elif response.status_code == 404:
-                logger.warning(f"GitHub resource not found: {endpoint}")
+
+            started = time.monotonic()
+            try:
+                with self._connection_slots():
+                    if json_body is None:
+                        response = session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+                    else:
+                        response = session.post(
+                            url, headers=headers, json=json_body, timeout=self.REQUEST_TIMEOUT
+                        )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record_latency(endpoint, started)
+                breaker.record_failure()
+                if attempt < self.MAX_RETRIES:
+                    logger.warning(f"Retrying {endpoint} after request error: {str(e)}")
+                    self._backoff(attempt)
+                    continue
+                logger.error(f"Request error when fetching {endpoint}: {str(e)}")
                 return None
-            else:
-                logger.error(f"GitHub API error {response.status_code} for {endpoint}")
+            except requests.RequestException as e:
+                self._record_latency(endpoint, started)
+                breaker.record_failure()
+                logger.error(f"Request error when fetching {endpoint}: {str(e)}")
                 return None
 
-        except requests.RequestException as e:
-            logger.error(f"Request error when fetching {endpoint}: {str(e)}")
+            self._record_latency(endpoint, started)
+            self._update_rate_limit(response)
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if response.status_code >= 500 and attempt < self.MAX_RETRIES:
+                logger.warning(f"Retrying {endpoint} after GitHub API error {response.status_code}")
+                self._backoff(attempt)
+                continue
+            return response
+
+    def _rate_limit_key(self):
+        # Authenticated and anonymous requests, REST and GraphQL have separate quotas
+        auth = "token" if "Authorization" in self.headers else "anonymous"
+        return f"github_rate_limit_{self.RATE_LIMIT_RESOURCE}_{auth}"
+
+    def _update_rate_limit(self, response):
+        """Share the budget reported by GitHub through the cache until it resets"""
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+
+        if response.status_code in (403, 429) and headers.get("Retry-After"):
+            # Secondary rate limit
+            remaining, reset = 0, time.time() + int(headers["Retry-After"])
+        if remaining is None or reset is None:
+            return
+
+        budget = {"remaining": int(remaining), "reset": int(float(reset))}
+        cache.set(self._rate_limit_key(), budget, max(budget["reset"] - time.time(), 1))
+
+    def rate_limit(self):
+        """Last known {"remaining", "reset"} budget, None when unknown or already reset"""
+        budget = cache.get(self._rate_limit_key())
+        if budget and budget["reset"] > time.time():
+            return budget
+        return None
+
+    def _rate_limit_exhausted(self):
+        budget = self.rate_limit()
+        return budget is not None and budget["remaining"] <= 0
+
+    def _rate_limit_low(self, reserve=None):
+        reserve = self.RATE_LIMIT_RESERVE if reserve is None else reserve
+        budget = self.rate_limit()
+        return budget is not None and budget["remaining"] < reserve
+
+    def _parse_response(self, response, endpoint):
+        """Decoded JSON of a successful response, None otherwise"""
+        if response is None:
             return None
 
-    def get_user_profile(self):
-        """Fetch user profile information"""
-        cache_key = f"github_profile_{self.username}"
-        cached_data = cache.get(cache_key)
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 403:
+            logger.warning(f"GitHub API rate limit exceeded for {endpoint}")
+            return None
+        elif response.status_code == 404:
+            logger.warning(f"GitHub resource not found: {endpoint}")
+            return None
+        else:
+            logger.error(f"GitHub API error {response.status_code} for {endpoint}")
+            return None
 
-        if cached_data:
-            return cached_data
-
-        profile_data = self._make_request(f"users/{self.username}")
-
-        if profile_data:
-            # Extract relevant information
-            processed_data = {
-                "login": profile_data.get("login"),
-                "name": profile_data.get("name"),
-                "bio": profile_data.get("bio"),
-                "location": profile_data.get("location"),
-                "public_repos": profile_data.get("public_repos", 0),
-                "followers": profile_data.get("followers", 0),
-                "following": profile_data.get("following", 0),
-                "created_at": profile_data.get("created_at"),
-                "updated_at": profile_data.get("updated_at"),
-                "avatar_url": profile_data.get("avatar_url"),
-                "html_url": profile_data.get("html_url"),
-                "company": profile_data.get("company"),
-                "blog": profile_data.get("blog"),
-                "email": profile_data.get("email"),
-                "hireable": profile_data.get("hireable"),
-            }
+    def _make_request(self, endpoint):
+        """Make a request to GitHub API with error handling"""
+        return self._parse_response(self._request(endpoint), endpoint)
+
+    def _cached_fetch(self, cache_key, endpoint, process, paginate=False):
+        """
+        Processed data for an endpoint with stale-while-revalidate caching.
 
-            # Cache the processed data
-            cache.set(cache_key, processed_data, self.CACHE_TIMEOUT)
-            return processed_data
+        Entries are fresh for CACHE_TIMEOUT (soft TTL) and kept for
+        HARD_CACHE_TIMEOUT. A stale entry is served right away while a single
+        background refresh revalidates it; only a miss waits on GitHub, and
+        concurrent misses for the same key share one upstream call. With
+        `force_refresh` the entry is revalidated before returning.
+        """
+        return self._stale_while_revalidate(
+            cache_key, endpoint, lambda: self._refresh(cache_key, endpoint, process, paginate)
+        )
 
-        return self._get_fallback_profile()
+    def _cached_compute(self, cache_key, endpoint, compute):
+        """
+        Data derived from several calls (`compute`), with the same soft and
+        hard TTLs as _cached_fetch. `endpoint` names the GitHub resource it
+        is built from, for logs and the circuit breaker.
+        """
+        def refresh():
+            entry = cache.get(cache_key)
+            data = compute()
+            if data is None:
+                return entry["data"] if entry else None
+            cache.set(
+                cache_key,
+                {"data": data, "etag": None, "last_modified": None,
+                 "fresh_until": time.time() + self.CACHE_TIMEOUT},
+                self.HARD_CACHE_TIMEOUT,
+            )
+            return data
 
-    def get_repositories(self, per_page=30, sort="updated"):
-        """Fetch user repositories"""
-        cache_key = f"github_repos_{self.username}_{per_page}_{sort}"
-        cached_data = cache.get(cache_key)
+        return self._stale_while_revalidate(cache_key, endpoint, refresh)
+
+    def _stale_while_revalidate(self, cache_key, endpoint, refresh):
+        if self.force_refresh:
+            with self._key_lock(cache_key):
+                return refresh()
+
+        entry = cache.get(cache_key)
+        if entry and entry["fresh_until"] > time.time():
+            self._count("hit")
+            return entry["data"]
+
+        if entry:
+            self._count("stale")
+            self._refresh_in_background(cache_key, endpoint, refresh)
+            return entry["data"]
+
+        self._count("miss")
+        with self._key_lock(cache_key):
+            entry = cache.get(cache_key)
+            if entry:
+                # Another request filled it while this one waited
+                return entry["data"]
+            return refresh()
+
+    def _refresh(self, cache_key, endpoint, process, paginate=False):
+        """
+        Fetch an endpoint into the cache. Cached entries carry the response
+        ETag/Last-Modified and are revalidated with a conditional request: a
+        304 (which does not count against the rate limit) only extends their
+        freshness. With `paginate`, `process` receives the items of every page
+        the first response links to; a 304 on the first page counts for all.
+        """
+        entry = cache.get(cache_key)
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._fetch(endpoint, headers)
+
+        if entry and response is not None and response.status_code == 304:
+            entry["fresh_until"] = time.time() + self.CACHE_TIMEOUT
+            cache.set(cache_key, entry, self.HARD_CACHE_TIMEOUT)
+            self.refresh_outcomes[endpoint] = True
+            return entry["data"]
+
+        data = self._parse_response(response, endpoint)
+        if data is None:
+            # Upstream failed, expired data still beats no data
+            self.refresh_outcomes[endpoint] = False
+            return entry["data"] if entry else None
+
+        try:
+            if paginate:
+                data = self._iter_pages(endpoint, response, data)
+            processed = process(data)
+        except GitHubPageError as e:
+            logger.error(str(e))
+            self.refresh_outcomes[endpoint] = False
+            return entry["data"] if entry else None
+
+        entry = {
+            "data": processed,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fresh_until": time.time() + self.CACHE_TIMEOUT,
+        }
+        cache.set(cache_key, entry, self.HARD_CACHE_TIMEOUT)
+        self.refresh_outcomes[endpoint] = True
+        return entry["data"]
+
+    def _fetch(self, endpoint, headers):
+        """Upstream request behind a cache refresh"""
+        return self._request(endpoint, headers=headers)
+
+    def _iter_pages(self, endpoint, first_response, first_page):
+        """
+        Items of every page of a paginated endpoint. The page count comes from
+        the first response Link header; the remaining pages are fetched
+        concurrently and yielded as they arrive so no page is kept around.
+        """
+        yield from first_page
+
+        last_url = first_response.links.get("last", {}).get("url")
+        if not last_url:
+            return
+        last_page = int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+        if last_page > self.MAX_PAGES:
+            logger.warning(
+                f"{endpoint} has {last_page} pages, only the first {self.MAX_PAGES} are read"
+            )
+            last_page = self.MAX_PAGES
+        if last_page < 2:
+            return
+
+        separator = "&" if "?" in endpoint else "?"
+        executor = ThreadPoolExecutor(max_workers=min(self.PAGE_WORKERS, last_page - 1))
+        try:
+            futures = [
+                executor.submit(self._make_request, f"{endpoint}{separator}page={page}")
+                for page in range(2, last_page + 1)
+            ]
+            for future in as_completed(futures):
+                page = future.result()
+                if page is None:
+                    raise GitHubPageError(f"Incomplete pagination for {endpoint}")
+                yield from page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refresh_in_background(self, cache_key, endpoint, refresh):
+        # cache.add only succeeds for one caller, across processes when the
+        # cache backend is shared
+        if self._rate_limit_low():
+            # Keep the remaining quota for misses, stale data is served until the reset
+            return
+        if self._circuit(self._url(endpoint)).state == CircuitBreaker.OPEN:
+            return
 
-        if cached_data:
-            return cached_data
+        lock_key = f"{cache_key}_refreshing"
+        if not cache.add(lock_key, True, self.REFRESH_LOCK_TIMEOUT):
+            return
 
-        repos_data = self._make_request(
-            f"users/{self.username}/repos?per_page={per_page}&sort={sort}"
+        def run():
+            try:
+                refresh()
+            except Exception as e:
+                logger.error(f"Background refresh of {endpoint} failed: {str(e)}")
+            finally:
+                cache.delete(lock_key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    @staticmethod
+    def _key_lock(cache_key):
+        with _key_locks_lock:
+            return _key_locks.setdefault(cache_key, threading.Lock())
+
+    @staticmethod
+    def _count(outcome):
+        with _cache_stats_lock:
+            _cache_stats[outcome] += 1
+
+    @staticmethod
+    def cache_stats():
+        """Hit, stale and miss counts of the GitHub data cache"""
+        with _cache_stats_lock:
+            return dict(_cache_stats)
+
+    def get_user_profile(self):
+        """Fetch user profile information"""
+        profile = self._cached_fetch(
+            f"github_profile_{self.username}",
+            f"users/{self.username}",
+            self._process_profile,
         )
+        return profile or self._get_fallback_profile()
 
-        if repos_data:
-            # Process repositories data
-            processed_repos = []
-            seen_repo_names = set()  # Track repository names to avoid duplicates
+    def _process_profile(self, profile_data):
+        # Extract relevant information
+        return {
+            "login": profile_data.get("login"),
+            "name": profile_data.get("name"),
+            "bio": profile_data.get("bio"),
+            "location": profile_data.get("location"),
+            "public_repos": profile_data.get("public_repos", 0),
+            "followers": profile_data.get("followers", 0),
+            "following": profile_data.get("following", 0),
+            "created_at": profile_data.get("created_at"),
+            "updated_at": profile_data.get("updated_at"),
+            "avatar_url": profile_data.get("avatar_url"),
+            "html_url": profile_data.get("html_url"),
+            "company": profile_data.get("company"),
+            "blog": profile_data.get("blog"),
+            "email": profile_data.get("email"),
+            "hireable": profile_data.get("hireable"),
+        }
 
-            for repo in repos_data:
-                repo_name = repo.get("name")
+    def get_repositories(self, per_page=100, sort="updated"):
+        """Fetch all user repositories, following the pagination"""
+        return self._fetch_repositories(per_page, sort) or []
 
-                # Skip duplicates and forks for main display
-                if repo_name in seen_repo_names or repo.get("fork", False):
-                    continue
+    def _fetch_repositories(self, per_page=100, sort="updated"):
+        """Like get_repositories(), but None when they could not be fetched"""
+        return self._cached_fetch(
+            f"github_repos_{self.username}_{per_page}_{sort}",
+            f"users/{self.username}/repos?per_page={per_page}&sort={sort}",
+            self._process_repositories,
+            paginate=True,
+        )
 
-                seen_repo_names.add(repo_name)
-
-                processed_repo = {
-                    "name": repo_name,
-                    "description": repo.get("description"),
-                    "html_url": repo.get("html_url"),
-                    "language": repo.get("language"),
-                    "stargazers_count": repo.get("stargazers_count", 0),
-                    "forks_count": repo.get("forks_count", 0),
-                    "watchers_count": repo.get("watchers_count", 0),
-                    "size": repo.get("size", 0),
-                    "created_at": repo.get("created_at"),
-                    "updated_at": repo.get("updated_at"),
-                    "pushed_at": repo.get("pushed_at"),
-                    "private": repo.get("private", False),
-                    "fork": repo.get("fork", False),
-                    "archived": repo.get("archived", False),
-                    "topics": repo.get("topics", []),
-                }
-                processed_repos.append(processed_repo)
+    def _process_repositories(self, repos_data):
+        processed_repos = []
+        seen_repo_names = set()  # Track repository names to avoid duplicates
+
+        for repo in repos_data:
+            repo_name = repo.get("name")
 
-            # Sort by stargazers count for better display (most popular first)
-            processed_repos.sort(key=lambda x: x["stargazers_count"], reverse=True)
+            # Skip duplicates and forks for main display
+            if repo_name in seen_repo_names or repo.get("fork", False):
+                continue
 
-            # Cache the processed data
-            cache.set(cache_key, processed_repos, self.CACHE_TIMEOUT)
-            return processed_repos
+            seen_repo_names.add(repo_name)
+
+            processed_repo = {
+                "name": repo_name,
+                "description": repo.get("description"),
+                "html_url": repo.get("html_url"),
+                "language": repo.get("language"),
+                "stargazers_count": repo.get("stargazers_count", 0),
+                "forks_count": repo.get("forks_count", 0),
+                "watchers_count": repo.get("watchers_count", 0),
+                "size": repo.get("size", 0),
+                "created_at": repo.get("created_at"),
+                "updated_at": repo.get("updated_at"),
+                "pushed_at": repo.get("pushed_at"),
+                "private": repo.get("private", False),
+                "fork": repo.get("fork", False),
+                "archived": repo.get("archived", False),
+                "topics": repo.get("topics", []),
+            }
+            processed_repos.append(processed_repo)
 
-        return []
+        # Sort by stargazers count for better display (most popular first)
+        processed_repos.sort(key=lambda x: x["stargazers_count"], reverse=True)
+        return processed_repos
 
-    def get_repository_languages(self):
+    def get_repository_languages(self, weighted=None):
         """Fetch languages used across all repositories"""
-        cache_key = f"github_languages_{self.username}"
-        cached_data = cache.get(cache_key)
+        if weighted is None:
+            weighted = getattr(settings, "GITHUB_WEIGHTED_LANGUAGES", False)
+        if weighted:
+            return self.get_language_bytes()
 
-        if cached_data:
-            return cached_data
+        return self._cached_compute(
+            f"github_languages_{self.username}",
+            f"users/{self.username}/repos",
+            self._count_languages,
+        ) or []
 
-        repos = self.get_repositories()
+    def _count_languages(self):
+        repos = self._fetch_repositories()
+        if repos is None:
+            # Keep the previous counts rather than caching an empty list as fresh
+            return None
         language_stats = {}
 
         for repo in repos:
@@ -158,68 +613,137 @@ class GitHubService:
                     language_stats[lang] = 1
 
         # Sort by usage count
-        sorted_languages = sorted(
+        return sorted(
             language_stats.items(), key=lambda x: x[1], reverse=True
         )
 
-        # Cache the data
-        cache.set(cache_key, sorted_languages, self.CACHE_TIMEOUT)
-        return sorted_languages
+    def get_language_bytes(self):
+        """
+        Languages across all repositories weighted by their size in bytes.
+        Once computed, the aggregate is served stale-while-revalidate, so
+        the per-repository fan-out never runs on a request that has data.
+        """
+        return self._cached_compute(
+            f"github_language_bytes_{self.username}",
+            f"users/{self.username}/repos",
+            self._sum_language_bytes,
+        ) or []
 
-    def get_user_events(self, per_page=10):
-        """Fetch recent user activity events"""
-        cache_key = f"github_events_{self.username}_{per_page}"
+    def _sum_language_bytes(self):
+        repos = self._fetch_repositories()
+        if repos is None:
+            return None
+        repos = [repo for repo in repos if not repo["fork"]]
+        language_stats = {}
+
+        if repos:
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_WORKERS, len(repos))) as executor:
+                for languages in executor.map(self._get_repo_languages, repos):
+                    for lang, size in languages.items():
+                        language_stats[lang] = language_stats.get(lang, 0) + size
+
+        return sorted(
+            language_stats.items(), key=lambda x: x[1], reverse=True
+        )
+
+    def _get_repo_languages(self, repo):
+        """
+        Byte count per language of one repository, cached until the repository
+        is pushed again so a refresh only refetches repositories that changed
+        """
+        cache_key = f"github_repo_languages_{self.username}_{repo['name']}"
         cached_data = cache.get(cache_key)
 
-        if cached_data:
-            return cached_data
+        if cached_data and (
+            cached_data["pushed_at"] == repo["pushed_at"] or self._rate_limit_low()
+        ):
+            return cached_data["languages"]
 
-        events_data = self._make_request(
-            f"users/{self.username}/events?per_page={per_page}"
+        endpoint = f"repos/{self.username}/{repo['name']}/languages"
+        languages = self._make_request(endpoint)
+        self.refresh_outcomes[endpoint] = languages is not None
+        if languages is None:
+            return cached_data["languages"] if cached_data else {}
+
+        cache.set(
+            cache_key,
+            {"pushed_at": repo["pushed_at"], "languages": languages},
+            self.HARD_CACHE_TIMEOUT,
         )
+        return languages
 
-        if events_data:
-            # Process events data
-            processed_events = []
-            for event in events_data:
-                processed_event = {
-                    "type": event.get("type"),
-                    "repo_name": event.get("repo", {}).get("name"),
-                    "created_at": event.get("created_at"),
-                    "public": event.get("public", True),
-                }
+    def get_user_events(self, per_page=10):
+        """Fetch recent user activity events"""
+        events = self._cached_fetch(
+            f"github_events_{self.username}_{per_page}",
+            f"users/{self.username}/events?per_page={per_page}",
+            self._process_events,
+        )
+        return events or []
 
-                # Add event-specific data
-                if event.get("payload"):
-                    payload = event["payload"]
-                    if event["type"] == "PushEvent":
-                        processed_event["commits"] = len(payload.get("commits", []))
-                        processed_event["ref"] = payload.get("ref", "").replace(
-                            "refs/heads/", ""
-                        )
-                    elif event["type"] == "CreateEvent":
-                        processed_event["ref_type"] = payload.get("ref_type")
-                        processed_event["ref"] = payload.get("ref")
-                    elif event["type"] == "IssuesEvent":
-                        processed_event["action"] = payload.get("action")
-                    elif event["type"] == "PullRequestEvent":
-                        processed_event["action"] = payload.get("action")
+    def _process_events(self, events_data):
+        processed_events = []
+        for event in events_data:
+            processed_event = {
+                "type": event.get("type"),
+                "repo_name": event.get("repo", {}).get("name"),
+                "created_at": event.get("created_at"),
+                "public": event.get("public", True),
+            }
 
-                processed_events.append(processed_event)
+            # Add event-specific data
+            if event.get("payload"):
+                payload = event["payload"]
+                if event["type"] == "PushEvent":
+                    processed_event["commits"] = len(payload.get("commits", []))
+                    processed_event["ref"] = payload.get("ref", "").replace(
+                        "refs/heads/", ""
+                    )
+                elif event["type"] == "CreateEvent":
+                    processed_event["ref_type"] = payload.get("ref_type")
+                    processed_event["ref"] = payload.get("ref")
+                elif event["type"] == "IssuesEvent":
+                    processed_event["action"] = payload.get("action")
+                elif event["type"] == "PullRequestEvent":
+                    processed_event["action"] = payload.get("action")
 
-            # Cache the processed data
-            cache.set(cache_key, processed_events, self.CACHE_TIMEOUT)
-            return processed_events
+            processed_events.append(processed_event)
+        return processed_events
 
-        return []
+    def _get_repositories_and_languages(self):
+        repos = self.get_repositories()
+        return repos, self.get_repository_languages()
 
     def get_comprehensive_stats(self):
         """Get comprehensive GitHub statistics"""
-        profile = self.get_user_profile()
-        repos = self.get_repositories()
-        languages = self.get_repository_languages()
-        events = self.get_user_events()
+        # Independent upstream calls run concurrently; whatever misses the
+        # overall deadline is replaced by fallback data and keeps running in
+        # the background so its result lands in the cache for the next request
+        executor = ThreadPoolExecutor(max_workers=3)
+        futures = {
+            executor.submit(self.get_user_profile): "profile",
+            executor.submit(self._get_repositories_and_languages): "repositories",
+            executor.submit(self.get_user_events): "events",
+        }
+        done, _ = wait(futures, timeout=self.STATS_DEADLINE)
+        executor.shutdown(wait=False)
+
+        results = {}
+        for future, name in futures.items():
+            if future not in done:
+                logger.warning(f"GitHub {name} for {self.username} missed the {self.STATS_DEADLINE}s deadline")
+            elif future.exception() is not None:
+                logger.error(f"GitHub {name} for {self.username} failed: {future.exception()}")
+            else:
+                results[name] = future.result()
+
+        profile = results.get("profile") or self._get_fallback_profile()
+        repos, languages = results.get("repositories", ([], []))
+        events = results.get("events", [])
+        partial = sorted(set(futures.values()) - set(results))
+        return self._build_stats(profile, repos, languages, events, partial)
 
+    def _build_stats(self, profile, repos, languages, events, partial):
         # Calculate additional stats
         total_stars = sum(
             repo["stargazers_count"] for repo in repos if not repo["fork"]
@@ -241,6 +765,7 @@ class GitHubService:
 
         return {
             "profile": profile,
+            "partial": partial,
             "repositories": repos,
             "languages": languages,
             "recent_activity": recent_activity,
@@ -299,3 +824,240 @@ class GitHubService:
             "email": None,
             "hireable": True,
         }
+
+
+class GitHubGraphQLService(GitHubService):
+    """
+    GitHubService backend fetching the profile, repositories (with their
+    languages) and recent contributions in one GraphQL query. The result is
+    normalized into the shapes the REST backend returns.
+    """
+
+    RATE_LIMIT_RESOURCE = "graphql"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+
+    REPOSITORY_FIELDS = """
+        totalCount
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          name description url isFork isPrivate isArchived
+          stargazerCount forkCount diskUsage createdAt updatedAt pushedAt
+          primaryLanguage { name }
+          repositoryTopics(first: 20) { nodes { topic { name } } }
+          languages(first: 20) { edges { size node { name } } }
+        }
+    """
+    QUERY = """
+    query($login: String!, $cursor: String) {
+      user(login: $login) {
+        login name bio location company email websiteUrl isHireable
+        avatarUrl url createdAt updatedAt
+        followers { totalCount }
+        following { totalCount }
+        publicRepositories: repositories(ownerAffiliations: OWNER, privacy: PUBLIC) { totalCount }
+        repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+                     isFork: false, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          %s
+        }
+        contributionsCollection {
+          commitContributionsByRepository(maxRepositories: 10) {
+            repository { nameWithOwner defaultBranchRef { name } }
+            contributions(first: 1) {
+              nodes { occurredAt commitCount }
+            }
+          }
+        }
+      }
+    }
+    """ % REPOSITORY_FIELDS
+    REPOSITORIES_QUERY = """
+    query($login: String!, $cursor: String) {
+      user(login: $login) {
+        repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, privacy: PUBLIC,
+                     isFork: false, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          %s
+        }
+      }
+    }
+    """ % REPOSITORY_FIELDS
+
+    def __init__(self, username="zabbix-byte"):
+        super().__init__(username)
+        self.graphql_url = getattr(settings, "GITHUB_GRAPHQL_URL", None) or self.GRAPHQL_URL
+
+    def _fetch(self, endpoint, headers):
+        # GraphQL POSTs are never answered with a 304, skip the validators
+        return self._request(
+            endpoint,
+            json_body={"query": self.QUERY, "variables": {"login": self.username}},
+        )
+
+    def _parse_response(self, response, endpoint):
+        data = super()._parse_response(response, endpoint)
+        if data is None:
+            return None
+        if not (data.get("data") or {}).get("user"):
+            logger.error(f"GitHub GraphQL error for {self.username}: {data.get('errors')}")
+            return None
+        return data["data"]["user"]
+
+    def get_comprehensive_stats(self):
+        """Get comprehensive GitHub statistics from a single GraphQL query"""
+        stats = self._cached_fetch(
+            f"github_graphql_{self.username}", self.graphql_url, self._process_user
+        )
+        if stats is None:
+            return self._build_stats(
+                self._get_fallback_profile(), [], [], [], ["profile", "repositories", "events"]
+            )
+        return self._build_stats(
+            stats["profile"], stats["repositories"], stats["languages"], stats["events"], []
+        )
+
+    def _more_repositories(self, connection):
+        """Repository nodes of the pages after the first one, 100 per round trip"""
+        nodes = list(connection["nodes"])
+        page_info = connection["pageInfo"]
+        pages = 1
+        while page_info["hasNextPage"] and pages < self.MAX_PAGES:
+            user = self._parse_response(
+                self._request(
+                    self.graphql_url,
+                    json_body={
+                        "query": self.REPOSITORIES_QUERY,
+                        "variables": {"login": self.username, "cursor": page_info["endCursor"]},
+                    },
+                ),
+                self.graphql_url,
+            )
+            if user is None:
+                raise GitHubPageError(f"Incomplete repository pagination for {self.username}")
+            connection = user["repositories"]
+            nodes.extend(connection["nodes"])
+            page_info = connection["pageInfo"]
+            pages += 1
+        if page_info["hasNextPage"]:
+            logger.warning(
+                f"{self.username} has more than {self.MAX_PAGES} pages of repositories, only the first are read"
+            )
+        return nodes
+
+    def _process_user(self, user):
+        profile = {
+            "login": user.get("login"),
+            "name": user.get("name"),
+            "bio": user.get("bio"),
+            "location": user.get("location"),
+            # forks included, like the REST public_repos
+            "public_repos": user["publicRepositories"]["totalCount"],
+            "followers": user["followers"]["totalCount"],
+            "following": user["following"]["totalCount"],
+            "created_at": user.get("createdAt"),
+            "updated_at": user.get("updatedAt"),
+            "avatar_url": user.get("avatarUrl"),
+            "html_url": user.get("url"),
+            "company": user.get("company"),
+            "blog": user.get("websiteUrl"),
+            "email": user.get("email") or None,
+            "hireable": user.get("isHireable"),
+        }
+
+        repos = []
+        language_counts = {}
+        language_bytes = {}
+        for repo in self._more_repositories(user["repositories"]):
+            language = (repo.get("primaryLanguage") or {}).get("name")
+            repos.append({
+                "name": repo["name"],
+                "description": repo.get("description"),
+                "html_url": repo.get("url"),
+                "language": language,
+                "stargazers_count": repo.get("stargazerCount", 0),
+                "forks_count": repo.get("forkCount", 0),
+                # REST watchers_count is the star count, not the subscribers
+                "watchers_count": repo.get("stargazerCount", 0),
+                "size": repo.get("diskUsage") or 0,
+                "created_at": repo.get("createdAt"),
+                "updated_at": repo.get("updatedAt"),
+                "pushed_at": repo.get("pushedAt"),
+                "private": repo.get("isPrivate", False),
+                "fork": repo.get("isFork", False),
+                "archived": repo.get("isArchived", False),
+                "topics": [
+                    node["topic"]["name"] for node in repo["repositoryTopics"]["nodes"]
+                ],
+            })
+            if language:
+                language_counts[language] = language_counts.get(language, 0) + 1
+            for edge in repo["languages"]["edges"]:
+                name = edge["node"]["name"]
+                language_bytes[name] = language_bytes.get(name, 0) + edge["size"]
+        repos.sort(key=lambda x: x["stargazers_count"], reverse=True)
+
+        weighted = getattr(settings, "GITHUB_WEIGHTED_LANGUAGES", False)
+        languages = sorted(
+            (language_bytes if weighted else language_counts).items(),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+
+        events = []
+        for item in user["contributionsCollection"]["commitContributionsByRepository"]:
+            for node in item["contributions"]["nodes"]:
+                events.append({
+                    "type": "PushEvent",
+                    "repo_name": item["repository"]["nameWithOwner"],
+                    "created_at": node["occurredAt"],
+                    "public": True,
+                    "commits": node["commitCount"],
+                    "ref": (item["repository"].get("defaultBranchRef") or {}).get("name", "main"),
+                })
+        events.sort(key=lambda x: x["created_at"], reverse=True)
+
+        return {"profile": profile, "repositories": repos, "languages": languages, "events": events}
+
+
+def refresh_accounts(usernames, workers=None, reserve=None):
+    """
+    Revalidate the cached comprehensive stats of several accounts concurrently.
+
+    Requests share the GITHUB_MAX_CONNECTIONS limit with the rest of the
+    process. An account is only started while more than `reserve`
+    (GITHUB_BATCH_RATE_RESERVE) requests are left in the rate limit budget,
+    the others are deferred to the next run so live traffic keeps its quota.
+    Returns a dict of username -> "refreshed", "partial", "deferred" or
+    "failed": an account is refreshed when GitHub answered every call, partial
+    when some calls failed or missed the deadline (their cached data is kept)
+    and failed when none was answered.
+    """
+    workers = workers or getattr(settings, "GITHUB_BATCH_WORKERS", 4)
+    reserve = getattr(settings, "GITHUB_BATCH_RATE_RESERVE", 100) if reserve is None else reserve
+
+    def refresh(username):
+        service = get_github_service(username=username)
+        if service._rate_limit_low(reserve):
+            return "deferred"
+        service.force_refresh = True
+        try:
+            stats = service.get_comprehensive_stats()
+        except Exception as e:
+            logger.error(f"Batch refresh of {username} failed: {str(e)}")
+            return "failed"
+        # get_comprehensive_stats() falls back to cached data instead of raising
+        outcomes = list(service.refresh_outcomes.values())
+        if not any(outcomes):
+            return "failed"
+        if stats["partial"] or not all(outcomes):
+            return "partial"
+        return "refreshed"
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(usernames, executor.map(refresh, usernames)))
+
+
+def get_github_service(username="zabbix-byte"):
+    """GitHubService for the configured GITHUB_BACKEND; GraphQL needs a token"""
+    backend = getattr(settings, "GITHUB_BACKEND", "rest")
+    if backend == "graphql" and getattr(settings, "GITHUB_TOKEN", None):
+        return GitHubGraphQLService(username=username)
+    return GitHubService(username=username)
@@ -4,7 +4,22 @@ PDF generation service for CV.
 Editorial, monocrome layout — same spirit as the site (serif, quiet hierarchy).
 """
 
+import copy
+import hashlib
 import io
+import json
+import os
+import re
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+from xml.sax.saxutils import escape
+
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
@@ -13,19 +28,20 @@ from reportlab.platypus import (
     BaseDocTemplate,
     PageTemplate,
     Frame,
-    Paragraph,
     Spacer,
     Table,
     TableStyle,
     HRFlowable,
     KeepTogether,
 )
+from reportlab.platypus import Paragraph as BaseParagraph
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.pdfbase.ttfonts import TTFont
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import http_date
 from django.conf import settings
-from pathlib import Path
 
 
 # ---- Palette (leerob-aligned) -------------------------------------------
@@ -33,107 +49,204 @@ INK = HexColor("#171717")
 MUTED = HexColor("#737373")
 LINE = HexColor("#e5e5e5")
 
-# Prefer Times (built-in serif). Optional STIX if present under static/fonts.
-_FONT = "Times-Roman"
-_FONT_BOLD = "Times-Bold"
-_FONT_ITALIC = "Times-Italic"
+
+class Paragraph(BaseParagraph):
+    """
+    Paragraph that keeps its line breaks for the last width it was wrapped
+    at. Platypus wraps every paragraph several times per build (KeepTogether,
+    tables, then the frame), and cached sections are stored pre-wrapped, so
+    their copies skip line breaking entirely.
+    """
+
+    def __deepcopy__(self, memo):
+        # Builds rebind the size and canvas attributes but never mutate the
+        # parsed text or line breaks, so a copy can share them
+        clone = copy.copy(self)
+        memo[id(self)] = clone
+        return clone
+
+    def wrap(self, availWidth, availHeight):
+        wrapped_width = getattr(self, "_wrapped_width", None)
+        # Frames and tables derive the same width in different float orders
+        if wrapped_width is not None and abs(wrapped_width - availWidth) < 1e-6:
+            return self.width, self.height
+        width, height = super().wrap(availWidth, availHeight)
+        if width == availWidth:
+            self._wrapped_width = availWidth
+        return width, height
+
+
+RANGE_RE = re.compile(r"^\s*bytes=(\d*)-(\d*)\s*$")
+
+# Prefer Times (built-in serif). STIX Two from static/fonts when present,
+# as .ttf or as the .woff2 files the site serves (decompressed with fontTools).
+try:
+    from fontTools.ttLib import TTFont as _WOFFFont
+except ImportError:  # fontTools is optional, Times is used without it
+    _WOFFFont = None
+
+
+class Fonts(NamedTuple):
+    regular: str
+    bold: str
+    italic: str
+
+
+TIMES = Fonts("Times-Roman", "Times-Bold", "Times-Italic")
+STIX = Fonts("STIXTwo", "STIXTwo-Bold", "STIXTwo-Italic")
+_STIX_FILES = Fonts("STIXTwoText-Regular", "STIXTwoText-Medium", "STIXTwoText-Italic")
+
+
+def _font_source(fonts_dir, stem):
+    """Path of a .ttf, or TrueType data of a .woff2, None when neither is usable"""
+    ttf = fonts_dir / f"{stem}.ttf"
+    if ttf.exists():
+        return str(ttf)
+    woff2 = fonts_dir / f"{stem}.woff2"
+    if woff2.exists() and _WOFFFont is not None:
+        font = _WOFFFont(str(woff2))
+        font.flavor = None
+        data = io.BytesIO()
+        font.save(data)
+        data.seek(0)
+        return data
+    return None
 
 
 def _register_fonts():
-    global _FONT, _FONT_BOLD, _FONT_ITALIC
+    """Register STIX Two once and return the font names to use"""
     fonts_dir = Path(settings.BASE_DIR) / "static" / "fonts"
-    regular = fonts_dir / "STIXTwoText-Regular.ttf"
-    bold = fonts_dir / "STIXTwoText-Medium.ttf"
-    if regular.exists() and bold.exists():
-        try:
-            pdfmetrics.registerFont(TTFont("STIXTwo", str(regular)))
-            pdfmetrics.registerFont(TTFont("STIXTwo-Bold", str(bold)))
-            _FONT = "STIXTwo"
-            _FONT_BOLD = "STIXTwo-Bold"
-            _FONT_ITALIC = "STIXTwo"
-        except Exception:
-            pass
+    try:
+        sources = Fonts(*(_font_source(fonts_dir, stem) for stem in _STIX_FILES))
+        if sources.regular is None or sources.bold is None:
+            return TIMES
+        pdfmetrics.registerFont(TTFont(STIX.regular, sources.regular))
+        pdfmetrics.registerFont(TTFont(STIX.bold, sources.bold))
+        if sources.italic is None:
+            return STIX._replace(italic=STIX.regular)
+        pdfmetrics.registerFont(TTFont(STIX.italic, sources.italic))
+        return STIX
+    except Exception:
+        return TIMES
+
+
+def _build_styles(fonts):
+    styles = getSampleStyleSheet()
+    add = styles.add
+
+    add(ParagraphStyle(
+        name="Name", fontName=fonts.bold, fontSize=18,
+        textColor=INK, leading=20, spaceAfter=2,
+    ))
+    add(ParagraphStyle(
+        name="JobTitle", fontName=fonts.regular, fontSize=10.5,
+        textColor=MUTED, leading=14, spaceAfter=4,
+    ))
+    add(ParagraphStyle(
+        name="Contact", fontName=fonts.regular, fontSize=9,
+        textColor=MUTED, leading=12, spaceAfter=10,
+    ))
+    add(ParagraphStyle(
+        name="Section", fontName=fonts.bold, fontSize=10,
+        textColor=INK, leading=12, spaceBefore=8, spaceAfter=2,
+    ))
+    add(ParagraphStyle(
+        name="Summary", fontName=fonts.regular, fontSize=9.4,
+        textColor=INK, leading=13, alignment=TA_LEFT,
+    ))
+    add(ParagraphStyle(
+        name="Role", fontName=fonts.bold, fontSize=10,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="Date", fontName=fonts.regular, fontSize=9,
+        textColor=MUTED, leading=12, alignment=TA_RIGHT,
+    ))
+    add(ParagraphStyle(
+        name="ExpBullet", fontName=fonts.regular, fontSize=9,
+        textColor=INK, leading=11.8,
+        leftIndent=10, bulletIndent=0, spaceAfter=1,
+    ))
+    add(ParagraphStyle(
+        name="SkillCat", fontName=fonts.bold, fontSize=9,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="SkillVal", fontName=fonts.regular, fontSize=9,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="Project", fontName=fonts.bold, fontSize=9.2,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="ProjectDesc", fontName=fonts.regular, fontSize=9,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="Tech", fontName=fonts.italic, fontSize=8.2,
+        textColor=MUTED, leading=11,
+    ))
+    add(ParagraphStyle(
+        name="EduTitle", fontName=fonts.bold, fontSize=9.2,
+        textColor=INK, leading=12,
+    ))
+    add(ParagraphStyle(
+        name="EduMeta", fontName=fonts.regular, fontSize=8.8,
+        textColor=MUTED, leading=11,
+    ))
+    return MappingProxyType(dict(styles.byName))
+
+
+class StyleRegistry(NamedTuple):
+    fonts: Fonts
+    styles: MappingProxyType
+
+
+_registry = None
+_registry_lock = threading.Lock()
+_sections = OrderedDict()
+_sections_lock = threading.Lock()
+
+
+def get_style_registry():
+    """Fonts and paragraph styles, built once per process and shared read-only by every generator"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            fonts = _register_fonts()
+            _registry = StyleRegistry(fonts, _build_styles(fonts))
+        return _registry
 
 
 class CVPDFGenerator:
     """Quiet, recruiter-focused editorial CV."""
 
+    # Bump whenever the layout or the hard-coded content changes, it is part
+    # of the cache key of the rendered PDFs
+    VERSION = 2
     PAGE_SIZE = A4
     MARGIN = 16 * mm
 
     def __init__(self):
-        _register_fonts()
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        registry = get_style_registry()
+        self.fonts = registry.fonts
+        self.styles = registry.styles
         self.content_width = self.PAGE_SIZE[0] - 2 * self.MARGIN
-
-    def _setup_custom_styles(self):
-        add = self.styles.add
-
-        add(ParagraphStyle(
-            name="Name", fontName=_FONT_BOLD, fontSize=18,
-            textColor=INK, leading=20, spaceAfter=2,
-        ))
-        add(ParagraphStyle(
-            name="JobTitle", fontName=_FONT, fontSize=10.5,
-            textColor=MUTED, leading=14, spaceAfter=4,
-        ))
-        add(ParagraphStyle(
-            name="Contact", fontName=_FONT, fontSize=9,
-            textColor=MUTED, leading=12, spaceAfter=10,
-        ))
-        add(ParagraphStyle(
-            name="Section", fontName=_FONT_BOLD, fontSize=10,
-            textColor=INK, leading=12, spaceBefore=8, spaceAfter=2,
-        ))
-        add(ParagraphStyle(
-            name="Summary", fontName=_FONT, fontSize=9.4,
-            textColor=INK, leading=13, alignment=TA_LEFT,
-        ))
-        add(ParagraphStyle(
-            name="Role", fontName=_FONT_BOLD, fontSize=10,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="Date", fontName=_FONT, fontSize=9,
-            textColor=MUTED, leading=12, alignment=TA_RIGHT,
-        ))
-        add(ParagraphStyle(
-            name="ExpBullet", fontName=_FONT, fontSize=9,
-            textColor=INK, leading=11.8,
-            leftIndent=10, bulletIndent=0, spaceAfter=1,
-        ))
-        add(ParagraphStyle(
-            name="SkillCat", fontName=_FONT_BOLD, fontSize=9,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="SkillVal", fontName=_FONT, fontSize=9,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="Project", fontName=_FONT_BOLD, fontSize=9.2,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="ProjectDesc", fontName=_FONT, fontSize=9,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="Tech", fontName=_FONT_ITALIC, fontSize=8.2,
-            textColor=MUTED, leading=11,
-        ))
-        add(ParagraphStyle(
-            name="EduTitle", fontName=_FONT_BOLD, fontSize=9.2,
-            textColor=INK, leading=12,
-        ))
-        add(ParagraphStyle(
-            name="EduMeta", fontName=_FONT, fontSize=8.8,
-            textColor=MUTED, leading=11,
-        ))
-
-    def generate_cv_pdf(self, context_data):
-        buffer = io.BytesIO()
+        # Shared with section copies instead of being deep copied
+        self._shared = {id(style): style for style in self.styles.values()}
+
+    def generate_cv_pdf(self, context_data, output=None):
+        """
+        Render the CV into `output` (any writable binary file) and return it.
+        Without one, a BytesIO is returned rewound to the start.
+        """
+        buffer = io.BytesIO() if output is None else output
+        name = context_data.get("name", "Vasile Ovidiu Ichim")
+        footer = (
+            context_data.get("footer", "Vasile Ovidiu Ichim · Co-founder & CTO · Valerdat"),
+            context_data.get("footer_right", "github.com/zabbix-byte"),
+        )
 
         doc = BaseDocTemplate(
             buffer,
@@ -142,44 +255,73 @@ class CVPDFGenerator:
             rightMargin=self.MARGIN,
             topMargin=self.MARGIN,
             bottomMargin=12 * mm,
-            title="Vasile Ovidiu Ichim — CV",
-            author="Vasile Ovidiu Ichim",
+            title=f"{name} — CV",
+            author=name,
         )
         frame = Frame(
             doc.leftMargin, doc.bottomMargin, doc.width, doc.height,
             id="main", leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0,
         )
         doc.addPageTemplates([
-            PageTemplate(id="cv", frames=[frame], onPage=self._draw_footer)
+            PageTemplate(
+                id="cv", frames=[frame],
+                onPage=lambda canvas, doc: self._draw_footer(canvas, doc, *footer),
+            )
         ])
 
-        elements = []
-        elements += self._header(context_data)
-        elements += self._summary()
-        elements += self._experience()
-        elements += self._bottom()
-
-        doc.build(elements)
-        pdf_value = buffer.getvalue()
-        buffer.close()
-        return io.BytesIO(pdf_value)
+        doc.build(self._elements(context_data))
+        if output is None:
+            buffer.seek(0)
+        return buffer
 
-    def _draw_footer(self, canvas, doc):
+    def _elements(self, context_data):
+        elements = []
+        elements += self._section("header", context_data, lambda: self._header(context_data))
+        elements += self._section("summary", None, self._summary)
+        elements += self._section("experience", None, self._experience)
+        elements += self._section("bottom", None, self._bottom)
+        return elements
+
+    def _section(self, name, content, build):
+        """
+        Flowables of a section, built once per content and reused. They are
+        kept pre-wrapped at the content width in a process-wide LRU
+        (PDF_SECTION_CACHE_SIZE), and every build gets a deep copy, since
+        layout mutates flowables. Hard-coded sections pass None as content and
+        rely on VERSION.
+        """
+        digest = hashlib.sha256(
+            json.dumps(content, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()
+        key = (type(self).__name__, self.VERSION, self.fonts, self.content_width, name, digest)
+
+        with _sections_lock:
+            flowables = _sections.get(key)
+            if flowables is not None:
+                _sections.move_to_end(key)
+
+        if flowables is None:
+            flowables = build()
+            measure = Canvas(io.BytesIO(), pagesize=self.PAGE_SIZE)
+            for flowable in flowables:
+                flowable.wrapOn(measure, self.content_width, self.PAGE_SIZE[1])
+            with _sections_lock:
+                _sections[key] = flowables
+                while len(_sections) > getattr(settings, "PDF_SECTION_CACHE_SIZE", 256):
+                    _sections.popitem(last=False)
+
+        return copy.deepcopy(flowables, dict(self._shared))
+
+    def _draw_footer(self, canvas, doc, left, right):
         canvas.saveState()
         canvas.setStrokeColor(LINE)
         canvas.setLineWidth(0.5)
         y = 8 * mm
         canvas.line(self.MARGIN, y + 4 * mm, self.PAGE_SIZE[0] - self.MARGIN, y + 4 * mm)
-        canvas.setFont(_FONT, 8)
+        canvas.setFont(self.fonts.regular, 8)
         canvas.setFillColor(MUTED)
-        canvas.drawString(
-            self.MARGIN, y,
-            "Vasile Ovidiu Ichim · Co-founder & CTO · Valerdat",
-        )
-        canvas.drawRightString(
-            self.PAGE_SIZE[0] - self.MARGIN, y,
-            "github.com/zabbix-byte",
-        )
+        canvas.drawString(self.MARGIN, y, left)
+        canvas.drawRightString(self.PAGE_SIZE[0] - self.MARGIN, y, right)
         canvas.restoreState()
 
     def _header(self, ctx):
@@ -243,7 +385,7 @@ class CVPDFGenerator:
 
     def _exp_entry(self, role, company, dates, bullets):
         head = Table(
-            [[Paragraph(f"{role} · {company}", self.styles["Role"]),
+            [[Paragraph(" · ".join(filter(None, [role, company])), self.styles["Role"]),
               Paragraph(dates, self.styles["Date"])]],
             colWidths=[self.content_width * 0.74, self.content_width * 0.26],
         )
@@ -430,14 +572,343 @@ class CVPDFGenerator:
         return flow
 
 
-def generate_cv_pdf_response(context_data):
-    """Generate PDF response for CV download."""
-    generator = CVPDFGenerator()
-    pdf_buffer = generator.generate_cv_pdf(context_data)
+class ProfilePDFGenerator(CVPDFGenerator):
+    """
+    Same layout, built from a scraped profile (UserProfileHtml.data) instead
+    of the hard-coded content. Scraped text is escaped, it is not markup.
+    """
+
+    def _elements(self, profile):
+        contact = {key: profile.get(key) for key in ("name", "title", "location", "email", "web_page", "phone_number")}
+        elements = self._section("header", contact, lambda: self._header(profile))
+        if profile.get("description"):
+            elements += self._section(
+                "summary", profile["description"], lambda: self._profile_summary(profile["description"])
+            )
+        if profile.get("experiences"):
+            elements += self._section(
+                "experience", profile["experiences"], lambda: self._profile_experiences(profile["experiences"])
+            )
+        if profile.get("projects"):
+            elements += self._section(
+                "projects", profile["projects"], lambda: self._profile_projects(profile["projects"])
+            )
+        if profile.get("licences"):
+            elements += self._section(
+                "licences", profile["licences"], lambda: self._profile_licences(profile["licences"])
+            )
+        if profile.get("education"):
+            elements += self._section(
+                "education", profile["education"], lambda: self._profile_education(profile["education"])
+            )
+        return elements
+
+    def _profile_summary(self, description):
+        return self._section_header("Profile") + [
+            Paragraph(_text(description), self.styles["Summary"]),
+            Spacer(1, 2),
+        ]
+
+    def _profile_experiences(self, experiences):
+        flow = self._section_header("Experience")
+        for experience in experiences:
+            flow += self._profile_experience(experience)
+        return flow
+
+    def _profile_licences(self, licences):
+        flow = self._section_header("Licences &amp; Certifications")
+        for licence in licences:
+            flow.append(self._dated_row(
+                _join(licence.get("name"), licence.get("emitted_by")),
+                licence.get("expedition"), "EduTitle",
+            ))
+        flow.append(Spacer(1, 4))
+        return flow
+
+    def _profile_education(self, education):
+        flow = self._section_header("Education")
+        for entry in education:
+            time = " – ".join(filter(None, [entry.get("time_start"), entry.get("time_end")]))
+            flow.append(self._dated_row(
+                _join(entry.get("name"), entry.get("entity"), " — "),
+                time, "EduTitle",
+            ))
+        return flow
+
+    def _header(self, profile):
+        contact = [_text(profile.get("location"))]
+        if profile.get("email"):
+            email = _text(profile["email"])
+            contact.append(f'<a href="mailto:{email}" color="#171717"><u>{email}</u></a>')
+        if profile.get("web_page"):
+            contact.append(_text(profile["web_page"]))
+        if profile.get("phone_number"):
+            contact.append(_text(profile["phone_number"]))
+
+        return [
+            Paragraph(_text(profile.get("name")), self.styles["Name"]),
+            Paragraph(_text(profile.get("title")), self.styles["JobTitle"]),
+            Paragraph("&nbsp;&nbsp;·&nbsp;&nbsp;".join(filter(None, contact)), self.styles["Contact"]),
+            HRFlowable(width="100%", thickness=0.6, color=LINE,
+                       spaceBefore=0, spaceAfter=8, lineCap="round"),
+        ]
+
+    def _dated_row(self, text, dates, style):
+        row = Table(
+            [[Paragraph(text, self.styles[style]),
+              Paragraph(_text(dates), self.styles["Date"])]],
+            colWidths=[self.content_width * 0.74, self.content_width * 0.26],
+        )
+        row.setStyle(TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 0),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ]))
+        return row
+
+    def _profile_experience(self, experience):
+        # A group is one company with several roles, the entry name is the company
+        roles = experience.get("group") or [experience]
+        company = _text(experience.get("name")) if experience.get("group") else None
+        flow = []
+        if company:
+            flow.append(Paragraph(company, self.styles["Role"]))
+        for role in roles:
+            bullets = [role["description"]] if role.get("description") else []
+            flow.append(self._exp_entry(
+                _text(role.get("name")), None, _text(role.get("time")),
+                [_text(bullet) for bullet in bullets],
+            ))
+        return flow
+
+    def _profile_projects(self, projects):
+        cells = [
+            self._project_cell(
+                _join(project.get("name"), project.get("time")),
+                _text(project.get("description")),
+            )
+            for project in projects
+        ]
+        if len(cells) % 2:
+            cells.append("")
+        gutter = 8 * mm
+        col_w = (self.content_width - gutter) / 2.0
+        grid = Table(
+            [cells[i:i + 2] for i in range(0, len(cells), 2)],
+            colWidths=[col_w, col_w],
+        )
+        grid.setStyle(TableStyle([
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LEFTPADDING", (0, 0), (0, -1), 0),
+            ("RIGHTPADDING", (0, 0), (0, -1), gutter),
+            ("LEFTPADDING", (1, 0), (1, -1), gutter),
+            ("RIGHTPADDING", (1, 0), (-1, -1), 0),
+            ("TOPPADDING", (0, 0), (-1, -1), 0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ]))
+        return self._section_header("Projects") + [grid, Spacer(1, 4)]
+
+
+def _text(value):
+    return escape(value or "")
+
+
+def _join(first, second, separator=" · "):
+    return separator.join(_text(part) for part in (first, second) if part)
+
+
+def profile_pdf_context(profile):
+    """Scraped profile plus the document metadata the generator reads"""
+    name = profile.get("name") or "CV"
+    return {
+        **profile,
+        "name": name,
+        "footer": " · ".join(filter(None, [name, profile.get("title")])),
+        "footer_right": profile.get("web_page") or profile.get("email") or "",
+    }
+
+
+def render_profile_pdf(profile, output=None):
+    return ProfilePDFGenerator().generate_cv_pdf(profile_pdf_context(profile), output)
+
+
+EXPORT_WINDOW = 2  # export jobs in flight per worker process
+
+
+def _render_profile_job(job):
+    """Process pool worker: render one profile to a path, or to bytes"""
+    filename, profile, directory = job
+    if directory is None:
+        return filename, render_profile_pdf(profile).getvalue()
+    path = Path(directory) / filename
+    with open(path, "wb") as output:
+        render_profile_pdf(profile, output)
+    return filename, None
+
+
+def _init_render_worker():
+    import django
+    django.setup()
+
+
+def _render_in_window(executor, jobs, window):
+    """Results of `jobs` in input order, with at most `window` of them submitted at once"""
+    pending = deque()
+    for job in jobs:
+        pending.append(executor.submit(_render_profile_job, job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def export_profile_pdfs(profiles, directory=None, zip_file=None, workers=None):
+    """
+    Render (username, profile data) pairs on a process pool. PDFs are written
+    by the workers to `directory`, or added to `zip_file` (a writable, not
+    necessarily seekable, binary file) in input order. Yields the filenames.
+    Only EXPORT_WINDOW jobs per worker are in flight, so `profiles` is
+    consumed lazily and finished PDFs do not pile up in memory.
+    """
+    if (directory is None) == (zip_file is None):
+        raise ValueError("Export to either a directory or a zip file")
+    if directory is not None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    jobs = (
+        (f"{username}_CV.pdf", profile, None if directory is None else str(directory))
+        for username, profile in profiles
+    )
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as executor:
+        results = _render_in_window(executor, jobs, workers * EXPORT_WINDOW)
+        if zip_file is None:
+            for filename, _ in results:
+                yield filename
+            return
+
+        with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename, data in results:
+                archive.writestr(filename, data)
+                yield filename
+
+
+def cv_pdf_etag(context_data):
+    """Content hash of a CV: its context and the generator version"""
+    payload = json.dumps(context_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(
+        f"{CVPDFGenerator.VERSION}:{payload}".encode()
+    ).hexdigest()
+
+
+def _cache_path(context_data):
+    cache_dir = Path(getattr(
+        settings, "CV_PDF_CACHE_DIR", Path(settings.BASE_DIR) / "var" / "cv_pdf"
+    ))
+    return cache_dir / f"{cv_pdf_etag(context_data)}.pdf"
+
+
+def cached_cv_pdf_mtime(context_data):
+    """Modification time of the cached PDF for the context, None if not rendered yet"""
+    try:
+        return os.path.getmtime(_cache_path(context_data))
+    except OSError:
+        return None
+
+
+def cached_cv_pdf(context_data):
+    """
+    Path of the rendered PDF for the context, rendering it on a cache miss.
+    Files are content addressed, so they survive restarts and are shared by
+    every process; a new context or generator VERSION is a new file.
+    """
+    path = _cache_path(context_data)
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Render aside and rename, so concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            CVPDFGenerator().generate_cv_pdf(context_data, tmp)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def _byte_range(range_header, size):
+    """
+    (start, end) of a single "bytes=" range, inclusive. None when the header
+    is absent or not one we serve (whole file instead), False when the range
+    cannot be satisfied.
+    """
+    match = RANGE_RE.match(range_header or "")
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last or int(last) == 0:
+            return False
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(pdf_file, start, length, chunk_size=FileResponse.block_size):
+    with pdf_file:
+        pdf_file.seek(start)
+        while length > 0:
+            chunk = pdf_file.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def generate_cv_pdf_response(context_data, request=None):
+    """
+    Stream the cached CV PDF from disk, without loading it into memory.
+    Honours a single-part Range header (206), unless an If-Range validator
+    no longer matches.
+    """
+    path = cached_cv_pdf(context_data)
+    size = path.stat().st_size
+    etag = f'"{cv_pdf_etag(context_data)}"'
+
+    byte_range = None
+    if request is not None:
+        if_range = request.headers.get("If-Range")
+        if if_range is None or if_range == etag:
+            byte_range = _byte_range(request.headers.get("Range"), size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif byte_range:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _read_range(path.open("rb"), start, end - start + 1),
+            status=206,
+            content_type="application/pdf",
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+    else:
+        # FileResponse sets Content-Length and uses wsgi.file_wrapper (sendfile) when available
+        response = FileResponse(path.open("rb"), content_type="application/pdf")
 
-    response = HttpResponse(content_type="application/pdf")
     response["Content-Disposition"] = (
         'attachment; filename="Vasile_Ovidiu_Ichim_CV.pdf"'
     )
-    response.write(pdf_buffer.getvalue())
+    response["Accept-Ranges"] = "bytes"
+    response["Cache-Control"] = "no-cache"
+    response["Last-Modified"] = http_date(path.stat().st_mtime)
     return response
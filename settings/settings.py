@@ -126,13 +126,40 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", None)  # Optional: for higher rate limits
 
 # Cache Configuration
+# Database backed so web workers and management commands (warm_github_cache)
+# share cached GitHub data, ETags, refresh locks and the rate limit budget:
+# add() is a single insert on the key, so only one process gets a refresh lock,
+# and a write is one row plus an indexed count for culling. The table is created
+# by `manage.py createcachetable`.
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": os.getenv("CACHE_TABLE", "django_cache"),
         "TIMEOUT": 3600,  # 1 hour
         "OPTIONS": {
-            "MAX_ENTRIES": 1000,
+            "MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", 20000)),
         },
     }
 }
+
+# LinkedIn scraper configuration
+SCRAPER_CHROMEDRIVER_PATH = os.getenv("SCRAPER_CHROMEDRIVER_PATH", "/usr/local/bin/chromedriver")
+SCRAPER_DRIVER_POOL_SIZE = int(os.getenv("SCRAPER_DRIVER_POOL_SIZE", 2))
+SCRAPER_DRIVER_MAX_AGE = int(os.getenv("SCRAPER_DRIVER_MAX_AGE", 1800))  # seconds before a driver is recycled
+SCRAPER_SECTION_WORKERS = int(os.getenv("SCRAPER_SECTION_WORKERS", 2))  # drivers fetching detail pages concurrently
+SCRAPER_SECTION_MAX_AGE = int(os.getenv("SCRAPER_SECTION_MAX_AGE", 86400))  # seconds before a section is fetched again
+SCRAPER_WORKER_CONCURRENCY = int(os.getenv("SCRAPER_WORKER_CONCURRENCY", 2))  # scrape jobs run at the same time
+SCRAPER_JOB_TIMEOUT = int(os.getenv("SCRAPER_JOB_TIMEOUT", 3600))  # seconds before a running job counts as dead
+SCRAPER_LOW_BANDWIDTH = os.getenv("SCRAPER_LOW_BANDWIDTH", "false").lower() == "true"  # opt-in: block images, media, fonts and trackers
+GITHUB_WEIGHTED_LANGUAGES = os.getenv("GITHUB_WEIGHTED_LANGUAGES", "false").lower() == "true"  # languages by bytes, one call per repo
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest")  # "rest" or "graphql" (one query per refresh, needs GITHUB_TOKEN)
+GITHUB_GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", "https://api.github.com/graphql")
+GITHUB_ACCOUNTS = [name for name in os.getenv("GITHUB_ACCOUNTS", "zabbix-byte").split(",") if name]  # served by /api/github-data/, first is the default
+GITHUB_MAX_CONNECTIONS = int(os.getenv("GITHUB_MAX_CONNECTIONS", 8))  # concurrent GitHub connections per process
+GITHUB_BATCH_WORKERS = int(os.getenv("GITHUB_BATCH_WORKERS", 4))  # accounts refreshed concurrently by warm_github_cache
+GITHUB_BATCH_RATE_RESERVE = int(os.getenv("GITHUB_BATCH_RATE_RESERVE", 100))  # requests left for live traffic
+GITHUB_CIRCUIT_FAILURES = int(os.getenv("GITHUB_CIRCUIT_FAILURES", 5))  # consecutive failures that open the circuit
+GITHUB_CIRCUIT_COOLDOWN = float(os.getenv("GITHUB_CIRCUIT_COOLDOWN", 30))  # seconds open before a half-open probe
+GITHUB_CIRCUIT_PROBES = int(os.getenv("GITHUB_CIRCUIT_PROBES", 1))  # calls let through while half-open
+CV_PDF_CACHE_DIR = Path(os.getenv("CV_PDF_CACHE_DIR", BASE_DIR / "var" / "cv_pdf"))  # rendered PDFs, keyed by content hash
+PDF_SECTION_CACHE_SIZE = int(os.getenv("PDF_SECTION_CACHE_SIZE", 256))  # pre-wrapped CV sections kept per process